@@ -195,7 +195,7 @@ def analyze_approach(airport: str, chart_name: str) -> ApproachAnalysis | None:
 def find_star_chart(charts: list[ChartInfo], star_name: str) -> ChartInfo | None:
     """Find a STAR chart by name using the same fuzzy matching as chart lookup.
 
-    This uses ChartQuery.parse to normalize the name (e.g., CCR2 -> CCR TWO)
+    This uses ChartQuery.from_parts to normalize the name (e.g., CCR2 -> CCR TWO)
     and find_chart_by_name for fuzzy matching (e.g., CCR TWO -> CONCORD TWO).
     """
     from zoa_ref.charts import ChartQuery, ChartType, find_chart_by_name
@@ -209,9 +209,10 @@ def find_star_chart(charts: list[ChartInfo], star_name: str) -> ChartInfo | None
         return None
 
     # Create a query with the STAR name - use a dummy airport since we already have charts
-    # The ChartQuery.parse normalizes the name (e.g., "CCR2" -> "CCR TWO")
+    # ChartQuery normalizes the name (e.g., "CCR2" -> "CCR TWO"); passing the
+    # tokens directly shares its memoized parse without building a query string
     try:
-        query = ChartQuery.parse(f"XXX {star_name}")
+        query = ChartQuery.from_parts(["XXX", *star_name.upper().split()])
         # Force the chart type to STAR for proper matching
         query = ChartQuery(
             airport=query.airport,
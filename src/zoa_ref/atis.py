@@ -6,6 +6,20 @@ from playwright.sync_api import Page, TimeoutError as PlaywrightTimeout
 
 ATIS_URL = "https://reference.oakartcc.org/atis"
 ATIS_AIRPORTS = ["SFO", "SJC", "RNO", "OAK", "SMF"]
+# Set form for membership checks, and the display string for error messages
+ATIS_AIRPORT_SET = frozenset(ATIS_AIRPORTS)
+ATIS_AIRPORTS_DISPLAY = ", ".join(ATIS_AIRPORTS)
+# Longest to wait for Blazor to render the ATIS blocks after page load
+ATIS_RENDER_TIMEOUT_MS = 2000
+
+# True once every requested airport has a rendered ATIS block
+_ATIS_BLOCKS_RENDERED_JS = """(airports) => {
+    const found = new Set();
+    for (const el of document.querySelectorAll("div.flex.mb-2")) {
+        found.add(el.innerText.trim().split("\\n", 1)[0].trim());
+    }
+    return airports.every((a) => found.has(a));
+}"""
 
 
 @dataclass
@@ -23,65 +37,63 @@ class AtisResult:
     atis_list: list[AtisInfo]
 
 
-def _navigate_to_atis_page(page: Page, timeout: int = 30000) -> bool:
-    """Navigate to ATIS page and wait for it to load."""
+def _navigate_to_atis_page(
+    page: Page, timeout: int = 30000, airports: list[str] | None = None
+) -> bool:
+    """Navigate to ATIS page and wait for it to load.
+
+    Waits until a block has rendered for each of the given airports instead
+    of sleeping for a fixed time. Airports without a current ATIS never get a
+    block, so the wait gives up after ATIS_RENDER_TIMEOUT_MS and the page is
+    scraped with whatever has rendered. Defaults to all ATIS_AIRPORTS.
+    """
+    if airports is None:
+        airports = ATIS_AIRPORTS
     try:
         page.goto(ATIS_URL, wait_until="networkidle", timeout=timeout)
-        # Wait for content to load - look for any ATIS text
-        page.wait_for_timeout(2000)  # Allow Blazor to render
-        return True
     except PlaywrightTimeout:
         return False
-
-
-def _scrape_atis_for_airport(page: Page, airport: str) -> AtisInfo | None:
-    """Scrape ATIS for a specific airport."""
     try:
-        airport = airport.upper()
+        page.wait_for_function(
+            _ATIS_BLOCKS_RENDERED_JS, arg=airports, timeout=ATIS_RENDER_TIMEOUT_MS
+        )
+    except PlaywrightTimeout:
+        pass
+    return True
 
-        # Each ATIS block is a div.flex.mb-2 containing airport code and text
-        # Find the div containing this airport's code
-        atis_blocks = page.locator("div.flex.mb-2").all()
 
-        for block in atis_blocks:
-            block_text = block.inner_text().strip()
-            # Check if this block starts with our airport code
-            lines = block_text.split("\n")
-            if lines and lines[0].strip() == airport:
-                return AtisInfo(airport=airport, raw_text=block_text)
+def _scrape_atis_blocks(page: Page) -> list[str]:
+    """Get the text of every ATIS block on the page.
 
-        return None
+    Each ATIS block is a div.flex.mb-2 whose first line is the airport code.
+    all_inner_texts() collects them in one round trip to the browser rather
+    than one inner_text() call per block.
+    """
+    try:
+        texts = page.locator("div.flex.mb-2").all_inner_texts()
     except Exception:
-        return None
+        return []
+    return [text.strip() for text in texts if text.strip()]
+
+
+def _scrape_atis_for_airport(page: Page, airport: str) -> AtisInfo | None:
+    """Scrape ATIS for a specific airport."""
+    airport = airport.upper()
+    for block_text in _scrape_atis_blocks(page):
+        # Check if this block starts with our airport code
+        if block_text.split("\n", 1)[0].strip() == airport:
+            return AtisInfo(airport=airport, raw_text=block_text)
+    return None
 
 
 def _scrape_all_atis(page: Page) -> list[AtisInfo]:
     """Scrape ATIS for all airports."""
     atis_list = []
-    try:
-        # Each ATIS block is a div.flex.mb-2
-        atis_blocks = page.locator("div.flex.mb-2").all()
-
-        for block in atis_blocks:
-            try:
-                block_text = block.inner_text().strip()
-                if not block_text:
-                    continue
-
-                # First line should be the airport code
-                lines = block_text.split("\n")
-                if not lines:
-                    continue
-
-                first_line = lines[0].strip()
-                if first_line in ATIS_AIRPORTS:
-                    atis_list.append(AtisInfo(airport=first_line, raw_text=block_text))
-            except Exception:
-                continue
-
-    except Exception:
-        pass
-
+    for block_text in _scrape_atis_blocks(page):
+        # First line should be the airport code
+        first_line = block_text.split("\n", 1)[0].strip()
+        if first_line in ATIS_AIRPORT_SET:
+            atis_list.append(AtisInfo(airport=first_line, raw_text=block_text))
     return atis_list
 
 
@@ -98,10 +110,10 @@ def fetch_atis(page: Page, airport: str, timeout: int = 30000) -> AtisInfo | Non
     """
     airport = airport.upper()
 
-    if airport not in ATIS_AIRPORTS:
+    if airport not in ATIS_AIRPORT_SET:
         return None
 
-    if not _navigate_to_atis_page(page, timeout):
+    if not _navigate_to_atis_page(page, timeout, airports=[airport]):
         return None
 
     return _scrape_atis_for_airport(page, airport)
@@ -15,7 +15,7 @@ if TYPE_CHECKING:
 
 from .atis import ATIS_AIRPORTS
 from .cache import cache_chart_list, get_cached_chart_list
-from .charts import ZOA_AIRPORTS, fetch_charts_from_api
+from .charts import ZOA_AIRPORTS, ZOA_AIRPORT_SET, fetch_charts_from_api
 from .commands import CHART_TYPE_ALIASES, VALID_CHART_TYPES
 from .frequency import get_prefetch_airports
 from .navaids import get_all_identifiers
@@ -272,7 +272,7 @@ class ZoaCompleter(Completer):
             yield from self._complete_airport_command(
                 first_word, words, word_index, current_prefix
             )
-        elif first_word_upper in ZOA_AIRPORTS:
+        elif first_word_upper in ZOA_AIRPORT_SET:
             # Implicit chart lookup: OAK CNDEL5
             yield from self._complete_chart_names(first_word_upper, current_prefix)
         elif first_word == "list":
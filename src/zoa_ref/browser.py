@@ -1,5 +1,6 @@
 """Browser automation module using Playwright."""
 
+import re
 import sys
 
 from playwright.sync_api import (
@@ -15,6 +16,13 @@ from contextlib import contextmanager
 TASKBAR_HEIGHT = 48
 # Aspect ratio for chart viewing (width:height)
 CHART_ASPECT_RATIO = 0.75  # 3:4 ratio, good for PDF viewing
+# Idle pages kept per session for reuse by short-lived scrapes
+MAX_IDLE_PAGES = 4
+# Static assets that scrape-only sessions never need to download
+_BLOCKED_RESOURCE_PATTERN = re.compile(
+    r"\.(?:png|jpe?g|gif|svg|webp|ico|woff2?|ttf|otf|mp4|webm)(?:[?#].*)?$",
+    re.IGNORECASE,
+)
 
 
 def _get_screen_size() -> tuple[int, int]:
@@ -56,9 +64,12 @@ class BrowserSession:
         headless: bool = False,
         window_size: tuple[int, int] | None = None,
         playwright: Playwright | None = None,
+        block_resources: bool = False,
     ):
         self.headless = headless
         self.window_size = window_size
+        # Abort image/font/media requests (for sessions that only scrape text)
+        self.block_resources = block_resources
         self._playwright: Playwright | None = playwright
         self._owns_playwright = (
             playwright is None
@@ -66,6 +77,7 @@ class BrowserSession:
         self._browser: Browser | None = None
         self._context: BrowserContext | None = None
         self._disconnected = False
+        self._idle_pages: list[Page] = []
 
     def start(self) -> None:
         """Start the browser session."""
@@ -86,6 +98,10 @@ class BrowserSession:
         self._browser.on("disconnected", self._on_disconnected)
         # Create a single context for all pages (tabs) in this session
         self._context = self._browser.new_context(no_viewport=True)
+        if self.block_resources:
+            self._context.route(
+                _BLOCKED_RESOURCE_PATTERN, lambda route: route.abort()
+            )
 
     def create_child_session(self, headless: bool = True) -> "BrowserSession":
         """Create a new browser session sharing the same Playwright instance."""
@@ -108,12 +124,15 @@ class BrowserSession:
 
     def stop(self) -> None:
         """Stop the browser session."""
-        if self._context:
-            self._context.close()
-            self._context = None
+        self._idle_pages.clear()
         if self._browser:
+            # Closing the browser closes its context and pages in one call
+            self._context = None
             self._browser.close()
             self._browser = None
+        elif self._context:
+            self._context.close()
+            self._context = None
         if self._playwright and self._owns_playwright:
             self._playwright.stop()
             self._playwright = None
@@ -124,6 +143,47 @@ class BrowserSession:
             raise RuntimeError("Browser not started. Call start() first.")
         return self._context.new_page()
 
+    @contextmanager
+    def borrow_page(self):
+        """Borrow a page for a short-lived operation, returning it to a pool.
+
+        Reuses an idle page when one is available instead of paying for a
+        fresh renderer setup and teardown on every lookup. On return the page
+        is parked on about:blank; beyond MAX_IDLE_PAGES it is closed instead.
+
+        Yields:
+            A Playwright page owned by this session.
+        """
+        page = None
+        while self._idle_pages:
+            candidate = self._idle_pages.pop()
+            if not candidate.is_closed():
+                page = candidate
+                break
+        if page is None:
+            page = self.new_page()
+
+        try:
+            yield page
+        finally:
+            self._release_page(page)
+
+    def _release_page(self, page: Page) -> None:
+        """Park a borrowed page for reuse, or close it if it can't be reused."""
+        if page.is_closed():
+            return
+        if self._context is not None and len(self._idle_pages) < MAX_IDLE_PAGES:
+            try:
+                page.goto("about:blank")
+                self._idle_pages.append(page)
+                return
+            except Exception:
+                pass
+        try:
+            page.close()
+        except Exception:
+            pass
+
     def find_page_by_url(self, url: str) -> Page | None:
         """Find an existing page by URL (exact match or prefix match).
 
@@ -8,6 +8,7 @@ Chart PDFs and analysis results are cached per-AIRAC cycle and automatically
 invalidate when a new cycle begins.
 """
 
+import hashlib
 import json
 import re
 import shutil
@@ -595,6 +596,33 @@ def get_processed_pdf_path(filename: str, airac: str) -> Path:
     return cache_dir / filename
 
 
+def get_processed_chart_pdf_path(
+    filename: str, pdf_urls: list[str], rotation: int | None, airac: str
+) -> Path:
+    """Get the cache path for a processed chart PDF keyed by its inputs.
+
+    The same chart can be produced with different rotations (or, across
+    re-publications, different source pages), so the processed file lives
+    in a subdirectory named after a hash of the source URLs and rotation.
+    The filename itself is left untouched so the browser tab title stays
+    readable.
+
+    Args:
+        filename: Pre-sanitized filename (e.g., "ZOA_OAK_ILS_RWY_28R.pdf")
+        pdf_urls: Source PDF URLs, in page order
+        rotation: Requested rotation in degrees, or None for auto-detect
+        airac: AIRAC cycle (e.g., "2512")
+
+    Returns:
+        Path to the processed PDF file
+    """
+    key_source = "|".join(pdf_urls) + f"|{rotation}"
+    key = hashlib.sha1(key_source.encode()).hexdigest()[:16]
+    cache_dir = CACHE_DIR / "processed" / airac / key
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir / filename
+
+
 # --- Chart List Caching (for autocomplete) ---
 
 
@@ -3,19 +3,25 @@
 import io
 import json
 import re
+import threading
+import time
 import urllib.request
 import urllib.error
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from playwright.sync_api import Page, TimeoutError as PlaywrightTimeout
 
-from zoa_ref.config import REFERENCE_BASE_URL, get_temp_dir
+from zoa_ref.config import CHARTS_API_TTL_SECONDS, REFERENCE_BASE_URL
 from zoa_ref.fuzzy import calculate_similarity as _calculate_similarity
 
 CHARTS_URL = f"{REFERENCE_BASE_URL}/charts"
 CHARTS_API_URL = "https://charts-api.oakartcc.org/v1/charts"
 USER_AGENT = "ZOA-Reference-CLI/1.0"
 
+# Upper bound on concurrent page downloads when merging multi-page charts
+MAX_PDF_DOWNLOAD_WORKERS = 8
+
 # Airport code to city/airport name mapping for procedure name expansion
 # Used to match queries like "RNO1" to "RENO ONE" at RNO airport
 AIRPORT_NAMES = {
@@ -85,6 +91,8 @@ ZOA_AIRPORTS = [
     "SUU",
     "TRK",
 ]
+# Set form for membership checks
+ZOA_AIRPORT_SET = frozenset(ZOA_AIRPORTS)
 
 
 class ChartType(Enum):
@@ -97,7 +105,7 @@ class ChartType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ChartQuery:
     """Parsed chart query."""
 
@@ -107,13 +115,32 @@ class ChartQuery:
 
     @classmethod
     def parse(cls, query: str) -> "ChartQuery":
-        """Parse a query string like 'OAK CNDEL5' into a ChartQuery."""
-        parts = query.strip().upper().split()
+        """Parse a query string like 'OAK CNDEL5' into a ChartQuery.
+
+        Results are memoized on the upper-cased, whitespace-split query, so
+        "oak cndel5" and "OAK  CNDEL5" share an entry. The dataclass is
+        frozen, so sharing instances is safe.
+        """
+        return cls.from_parts(query.upper().split())
+
+    @classmethod
+    def from_parts(cls, parts: list[str] | tuple[str, ...]) -> "ChartQuery":
+        """Build a ChartQuery from already upper-cased, whitespace-split tokens.
+
+        Lets callers that have split the query for their own checks reuse the
+        tokens instead of normalizing the string a second time.
+        """
         if len(parts) < 2:
             raise ValueError(
-                f"Invalid query format: '{query}'. Expected 'AIRPORT CHART_NAME'"
+                f"Invalid query format: '{' '.join(parts)}'. "
+                "Expected 'AIRPORT CHART_NAME'"
             )
+        return cls._parse_parts(tuple(parts))
 
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _parse_parts(cls, parts: tuple[str, ...]) -> "ChartQuery":
+        """Build a ChartQuery from normalized query tokens (memoized)."""
         airport = parts[0]
         chart_name = " ".join(parts[1:])
 
@@ -257,17 +284,31 @@ def _charts_from_payload(data: dict) -> list[ChartInfo]:
     return charts
 
 
+# Airport -> (fetch time, charts); shared with the autocomplete prefetch thread
+_charts_api_cache: dict[str, tuple[float, list[ChartInfo]]] = {}
+_charts_api_cache_lock = threading.Lock()
+
+
 def fetch_charts_from_api(airport: str) -> list[ChartInfo]:
     """
     Fetch charts for an airport from the charts API.
 
+    Non-empty responses are reused for CHARTS_API_TTL_SECONDS, so a list,
+    chart and charts lookup for the same airport make one request between them.
+
     Args:
         airport: FAA or ICAO airport identifier (e.g., "OAK" or "KOAK")
 
     Returns:
         List of ChartInfo objects for the airport.
     """
-    url = f"{CHARTS_API_URL}?apt={airport.upper()}"
+    airport = airport.upper()
+    with _charts_api_cache_lock:
+        entry = _charts_api_cache.get(airport)
+    if entry is not None and time.monotonic() - entry[0] < CHARTS_API_TTL_SECONDS:
+        return list(entry[1])
+
+    url = f"{CHARTS_API_URL}?apt={airport}"
 
     try:
         req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
@@ -288,7 +329,10 @@ def fetch_charts_from_api(airport: str) -> list[ChartInfo]:
 
         cache.cleanup_old_airac_caches(keep_cycles=2)
 
-    return charts
+        with _charts_api_cache_lock:
+            _charts_api_cache[airport] = (time.monotonic(), charts)
+
+    return list(charts)
 
 
 def search_chart_content(chart: ChartInfo, search_term: str) -> bool:
@@ -721,6 +765,41 @@ def strip_pdf_metadata(pdf_data: bytes) -> bytes:
         return pdf_data
 
 
+def _write_pdf_atomic(output_path: str, pdf_data: bytes) -> None:
+    """Write PDF bytes so output_path is never left half-written.
+
+    Processed charts are reused on later lookups whenever the file exists,
+    so an interrupted write must not leave a truncated PDF at the final path.
+    Each write gets its own temp file, so two processes rendering the same
+    chart can't interleave into one, and a failed write removes it.
+    """
+    import os
+    import tempfile
+
+    directory, name = os.path.split(os.path.abspath(output_path))
+    tmp = tempfile.NamedTemporaryFile(
+        dir=directory, prefix=f"{name}.", suffix=".partial", delete=False
+    )
+    try:
+        with tmp:
+            tmp.write(pdf_data)
+        os.replace(tmp.name, output_path)
+    except BaseException:
+        # Includes Ctrl+C mid-write; don't leave the temp file in the cache
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+        raise
+
+
+def _writer_to_bytes(writer) -> bytes:
+    """Serialize a pypdf PdfWriter to bytes."""
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
 def download_and_merge_pdfs(
     pdf_urls: list[str],
     output_path: str,
@@ -739,63 +818,43 @@ def download_and_merge_pdfs(
         True if successful, False otherwise.
     """
     from pypdf import PdfReader, PdfWriter
-    import tempfile
-    import os
 
     if not pdf_urls:
         return False
 
     writer = PdfWriter()
-    temp_files = []
-    pdf_data_list = []
     auto_detect = rotation is None
 
-    try:
-        # Download all PDFs first (using cache)
-        for url in pdf_urls:
-            pdf_data = download_pdf(url)
-            if not pdf_data:
-                print(f"Error downloading {url}")
-                return False
-            pdf_data_list.append(pdf_data)
-
-        # Process each PDF
-        for pdf_data in pdf_data_list:
-            # Auto-detect rotation for each PDF individually
-            if auto_detect:
-                page_rotation = detect_rotation_needed(pdf_data)
-            else:
-                page_rotation = rotation
-
-            # Write to temp file (pypdf needs a file, not bytes)
-            temp_fd, temp_path = tempfile.mkstemp(suffix=".pdf", dir=get_temp_dir())
-            temp_files.append(temp_path)
-            with os.fdopen(temp_fd, "wb") as f:
-                f.write(pdf_data)
-
-            # Read and append pages with optional rotation
-            reader = PdfReader(temp_path)
-            for page in reader.pages:
-                if page_rotation:
-                    page.rotate(page_rotation)
-                writer.add_page(page)
-
-        # Clear metadata so browser shows our filename
-        writer.add_metadata({})
-
-        # Write merged PDF
-        with open(output_path, "wb") as f:
-            writer.write(f)
+    # Download all PDFs first (using cache, concurrently)
+    pdf_data_list = download_pdfs(pdf_urls)
 
-        return True
+    for url, pdf_data in zip(pdf_urls, pdf_data_list):
+        if not pdf_data:
+            print(f"Error downloading {url}")
+            return False
 
-    finally:
-        # Clean up temp files
-        for temp_path in temp_files:
-            try:
-                os.unlink(temp_path)
-            except OSError:
-                pass
+    # Process each PDF
+    for pdf_data in pdf_data_list:
+        # Auto-detect rotation for each PDF individually
+        if auto_detect:
+            page_rotation = detect_rotation_needed(pdf_data)
+        else:
+            page_rotation = rotation
+
+        # Read and append pages with optional rotation
+        reader = PdfReader(io.BytesIO(pdf_data))
+        for page in reader.pages:
+            if page_rotation:
+                page.rotate(page_rotation)
+            writer.add_page(page)
+
+    # Clear metadata so browser shows our filename
+    writer.add_metadata({})
+
+    # Write merged PDF
+    _write_pdf_atomic(output_path, _writer_to_bytes(writer))
+
+    return True
 
 
 def download_and_rotate_pdf(
@@ -814,8 +873,6 @@ def download_and_rotate_pdf(
         True if successful, False otherwise.
     """
     from pypdf import PdfReader, PdfWriter
-    import tempfile
-    import os
 
     # Use cached download
     pdf_data = download_pdf(pdf_url)
@@ -830,34 +887,22 @@ def download_and_rotate_pdf(
     if not rotation:
         # No rotation needed, strip metadata and save
         clean_pdf = strip_pdf_metadata(pdf_data)
-        with open(output_path, "wb") as f:
-            f.write(clean_pdf)
+        _write_pdf_atomic(output_path, clean_pdf)
         return True
 
-    # Need to rotate - write to temp, read, rotate, write to output
-    temp_fd, temp_path = tempfile.mkstemp(suffix=".pdf", dir=get_temp_dir())
-    try:
-        with os.fdopen(temp_fd, "wb") as f:
-            f.write(pdf_data)
-
-        reader = PdfReader(temp_path)
-        writer = PdfWriter()
-        for page in reader.pages:
-            page.rotate(rotation)
-            writer.add_page(page)
+    # Need to rotate - read from memory, rotate, write to output
+    reader = PdfReader(io.BytesIO(pdf_data))
+    writer = PdfWriter()
+    for page in reader.pages:
+        page.rotate(rotation)
+        writer.add_page(page)
 
-        # Clear metadata so browser shows our filename
-        writer.add_metadata({})
+    # Clear metadata so browser shows our filename
+    writer.add_metadata({})
 
-        with open(output_path, "wb") as f:
-            writer.write(f)
+    _write_pdf_atomic(output_path, _writer_to_bytes(writer))
 
-        return True
-    finally:
-        try:
-            os.unlink(temp_path)
-        except OSError:
-            pass
+    return True
 
 
 def download_pdf(
@@ -899,6 +944,31 @@ def download_pdf(
     return pdf_data
 
 
+def download_pdfs(
+    pdf_urls: list[str], max_workers: int = MAX_PDF_DOWNLOAD_WORKERS
+) -> list[bytes | None]:
+    """Download several PDFs concurrently, preserving input order.
+
+    Each download is I/O bound, so fetching pages in parallel makes total
+    wall time roughly that of the slowest page rather than the sum.
+
+    Args:
+        pdf_urls: URLs of the PDFs to download
+        max_workers: Upper bound on concurrent downloads
+
+    Returns:
+        PDF bytes (or None on failure) for each URL, in the same order.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if len(pdf_urls) <= 1:
+        return [download_pdf(url) for url in pdf_urls]
+
+    workers = min(max_workers, len(pdf_urls))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(download_pdf, pdf_urls))
+
+
 def find_airport_page_in_min_chart(pdf_data: bytes, airport_code: str) -> int | None:
     """
     Find the page number for a specific airport in a MIN (minimums) chart.
@@ -1112,7 +1182,7 @@ def _find_chart_button(
         try:
             if btn.is_visible(timeout=100):
                 text = btn.inner_text().strip().upper()
-                if text and text not in ZOA_AIRPORTS and len(text) > 3:
+                if text and text not in ZOA_AIRPORT_SET and len(text) > 3:
                     visible_buttons.append((btn, text))
         except Exception:
             continue
@@ -1208,7 +1278,7 @@ def list_charts(page: Page, airport: str) -> list[str]:
         try:
             text = btn.inner_text().strip()
             # Skip airport codes and empty buttons
-            if text and text not in ZOA_AIRPORTS and len(text) > 3:
+            if text and text not in ZOA_AIRPORT_SET and len(text) > 3:
                 charts.append(text)
         except Exception:
             continue
@@ -1,16 +1,15 @@
 """CLI interface for ZOA Reference Tool lookups."""
 
-import webbrowser
-
 import click
 
 from .charts import ZOA_AIRPORTS
 from .cli_utils import (
     COMMAND_HELP,
+    CliContext,
     ImplicitChartGroup,
     reset_terminal_state,
     set_console_title,
-    print_interactive_help,
+    format_interactive_help,
 )
 from .completers import (
     complete_airport,
@@ -20,33 +19,9 @@ from .completers import (
     complete_facility,
     complete_navaid,
     complete_sop_query,
+    generate_bash_completion,
 )
 from .config import AIRSPACE_URL, TDLS_URL, STRIPS_URL
-from .commands import (
-    do_icao_lookup,
-    do_navaid_lookup,
-    do_airway_lookup,
-    do_descent_calc,
-    do_fix_descent,
-    do_mea_lookup,
-    do_metar_lookup,
-    do_route_lookup,
-    do_atis_lookup,
-    do_chart_lookup,
-    do_charts_browse,
-    do_list_charts,
-    handle_sop_command,
-    do_position_lookup,
-    do_scratchpad_lookup,
-    do_approaches_lookup,
-    do_setbrowser,
-    do_cifp_lookup,
-    do_uses_lookup,
-    do_vatsim_radar,
-)
-from .descent import is_fix_identifier
-from .distance import compute_bearing, compute_distance
-from .interactive import interactive_mode
 from .playwright_bootstrap import ensure_chromium_installed
 
 
@@ -76,6 +51,11 @@ def main(ctx, playwright: bool):
 
         zoa --playwright         - Interactive mode with managed browser
     """
+    if ctx.invoked_subcommand == "gen-completion":
+        # Its output is redirected into a script file: no title or terminal
+        # escapes, and no browser is needed
+        return
+
     # Set console title
     set_console_title("ZOA Ref CLI")
 
@@ -90,14 +70,21 @@ def main(ctx, playwright: bool):
     ensure_chromium_installed()
 
     # Store in context for subcommands that might need it
-    ctx.ensure_object(dict)
-    ctx.obj["playwright"] = playwright
+    ctx.obj = CliContext(playwright=playwright)
 
     if ctx.invoked_subcommand is None:
+        # Interactive mode pulls in prompt_toolkit and the completers, which
+        # one-shot subcommands never need
+        from .interactive import interactive_mode
+
         interactive_mode(use_playwright=playwright)
 
 
-@main.command(help=COMMAND_HELP["chart"].strip())
+_ROTATIONS = {"90": 90, "180": 180, "270": 270}
+_ROTATE_CHOICE = click.Choice(tuple(_ROTATIONS))
+
+
+@main.command(help=COMMAND_HELP["chart"])
 @click.argument("query", nargs=-1, required=True, shell_complete=complete_chart_query)
 @click.option(
     "--link", "-l", "link_only", is_flag=True, help="Output PDF URL only (don't open)"
@@ -105,7 +92,7 @@ def main(ctx, playwright: bool):
 @click.option("-r", "rotate_flag", is_flag=True, help="Rotate chart 90")
 @click.option(
     "--rotate",
-    type=click.Choice(["90", "180", "270"]),
+    type=_ROTATE_CHOICE,
     default=None,
     help="Rotate chart by specific degrees",
 )
@@ -117,8 +104,10 @@ def chart(
     rotate: str | None,
     no_rotate: bool,
 ):
+    from .commands import do_chart_lookup
+
     if rotate:
-        rotation: int | None = int(rotate)
+        rotation: int | None = _ROTATIONS[rotate]
     elif rotate_flag:
         rotation = 90
     elif no_rotate:
@@ -128,39 +117,52 @@ def chart(
     do_chart_lookup(" ".join(query), link_only=link_only, rotation=rotation)
 
 
-@main.command(help=COMMAND_HELP["charts"].strip())
+@main.command(help=COMMAND_HELP["charts"])
 @click.argument("query", nargs=-1, required=True, shell_complete=complete_chart_query)
 def charts(query: tuple[str, ...]):
+    from .commands import do_charts_browse
+
     do_charts_browse(" ".join(query))
 
 
-@main.command("list", help=COMMAND_HELP["list"].strip())
+@main.command("list", help=COMMAND_HELP["list"])
 @click.argument("airport", shell_complete=complete_airport)
 @click.argument(
     "chart_type", required=False, default=None, shell_complete=complete_chart_type
 )
 @click.argument("search_term", required=False, default=None)
 def list_cmd(airport: str, chart_type: str | None, search_term: str | None):
+    from .commands import do_list_charts
+
     do_list_charts(airport, chart_type, search_term)
 
 
+# Listed first by the 'airports' command, in this order
+_MAJOR_AIRPORTS = ("SFO", "OAK", "SJC", "SMF", "RNO", "FAT", "MRY", "BAB")
+_MAJOR_AIRPORT_SET = frozenset(_MAJOR_AIRPORTS)
+
+
 @main.command()
 def airports():
     """List all supported ZOA airports."""
-    click.echo("Supported ZOA airports:")
-    click.echo("-" * 40)
-
     # Group airports by type
-    major = ["SFO", "OAK", "SJC", "SMF", "RNO", "FAT", "MRY", "BAB"]
-    minor = [a for a in ZOA_AIRPORTS if a not in major]
-
-    click.echo("Major airports:")
-    click.echo(f"  {', '.join(major)}")
-    click.echo("\nOther airports:")
-    click.echo(f"  {', '.join(minor)}")
+    minor = [a for a in ZOA_AIRPORTS if a not in _MAJOR_AIRPORT_SET]
+
+    click.echo(
+        "\n".join(
+            (
+                "Supported ZOA airports:",
+                "-" * 40,
+                "Major airports:",
+                f"  {', '.join(_MAJOR_AIRPORTS)}",
+                "\nOther airports:",
+                f"  {', '.join(minor)}",
+            )
+        )
+    )
 
 
-@main.command(help=COMMAND_HELP["route"].strip())
+@main.command(help=COMMAND_HELP["route"])
 @click.argument("departure", shell_complete=complete_airport)
 @click.argument("arrival", shell_complete=complete_airport)
 @click.option("--browser", is_flag=True, help="Open browser instead of CLI display")
@@ -188,6 +190,8 @@ def route(
     flights: bool,
     top: int,
 ):
+    from .commands import do_route_lookup
+
     do_route_lookup(
         departure,
         arrival,
@@ -198,100 +202,73 @@ def route(
     )
 
 
-@main.command(help=COMMAND_HELP["airline"].strip())
+@main.command(help=COMMAND_HELP["airline"])
 @click.argument("query", nargs=-1, required=True)
 @click.option("--browser", is_flag=True, help="Open browser instead of CLI display")
 @click.option("--no-cache", is_flag=True, help="Bypass cache and fetch fresh data")
 def airline(query: tuple[str, ...], browser: bool, no_cache: bool):
-    do_icao_lookup("airline", " ".join(query), browser=browser, no_cache=no_cache)
+    from .commands import do_icao_lookup
 
-
-@main.command("al", help=COMMAND_HELP["airline"].strip())
-@click.argument("query", nargs=-1, required=True)
-@click.option("--browser", is_flag=True, help="Open browser instead of CLI display")
-@click.option("--no-cache", is_flag=True, help="Bypass cache and fetch fresh data")
-def al(query: tuple[str, ...], browser: bool, no_cache: bool):
     do_icao_lookup("airline", " ".join(query), browser=browser, no_cache=no_cache)
 
 
-@main.command(help=COMMAND_HELP["airport"].strip())
+@main.command(help=COMMAND_HELP["airport"])
 @click.argument("query", nargs=-1, required=True)
 @click.option("--browser", is_flag=True, help="Open browser instead of CLI display")
 @click.option("--no-cache", is_flag=True, help="Bypass cache and fetch fresh data")
 def airport(query: tuple[str, ...], browser: bool, no_cache: bool):
-    do_icao_lookup("airport", " ".join(query), browser=browser, no_cache=no_cache)
+    from .commands import do_icao_lookup
 
-
-@main.command("ap", help=COMMAND_HELP["airport"].strip())
-@click.argument("query", nargs=-1, required=True)
-@click.option("--browser", is_flag=True, help="Open browser instead of CLI display")
-@click.option("--no-cache", is_flag=True, help="Bypass cache and fetch fresh data")
-def ap(query: tuple[str, ...], browser: bool, no_cache: bool):
     do_icao_lookup("airport", " ".join(query), browser=browser, no_cache=no_cache)
 
 
-@main.command(help=COMMAND_HELP["aircraft"].strip())
+@main.command(help=COMMAND_HELP["aircraft"])
 @click.argument("query", nargs=-1, required=True)
 @click.option("--browser", is_flag=True, help="Open browser instead of CLI display")
 @click.option("--no-cache", is_flag=True, help="Bypass cache and fetch fresh data")
 def aircraft(query: tuple[str, ...], browser: bool, no_cache: bool):
-    do_icao_lookup("aircraft", " ".join(query), browser=browser, no_cache=no_cache)
+    from .commands import do_icao_lookup
 
-
-@main.command("ac", help=COMMAND_HELP["aircraft"].strip())
-@click.argument("query", nargs=-1, required=True)
-@click.option("--browser", is_flag=True, help="Open browser instead of CLI display")
-@click.option("--no-cache", is_flag=True, help="Bypass cache and fetch fresh data")
-def ac(query: tuple[str, ...], browser: bool, no_cache: bool):
     do_icao_lookup("aircraft", " ".join(query), browser=browser, no_cache=no_cache)
 
 
-@main.command(help=COMMAND_HELP["navaid"].strip())
+@main.command(help=COMMAND_HELP["navaid"])
 @click.argument("query", nargs=-1, required=True, shell_complete=complete_navaid)
 def navaid(query: tuple[str, ...]):
+    from .commands import do_navaid_lookup
+
     do_navaid_lookup(" ".join(query))
 
 
-@main.command(help=COMMAND_HELP["airway"].strip())
+@main.command(help=COMMAND_HELP["airway"])
 @click.argument("airway_id", required=True)
 @click.argument("highlights", nargs=-1)
 def airway(airway_id: str, highlights: tuple[str, ...]):
-    do_airway_lookup(airway_id, list(highlights) if highlights else None)
-
+    from .commands import do_airway_lookup
 
-@main.command("aw", help=COMMAND_HELP["airway"].strip())
-@click.argument("airway_id", required=True)
-@click.argument("highlights", nargs=-1)
-def aw(airway_id: str, highlights: tuple[str, ...]):
     do_airway_lookup(airway_id, list(highlights) if highlights else None)
 
 
-@main.command(help=COMMAND_HELP["descent"].strip())
+@main.command(help=COMMAND_HELP["descent"])
 @click.argument("first_arg")
 @click.argument("second_arg")
 def descent(first_arg: str, second_arg: str):
     # If both arguments are fix/airport/navaid identifiers, use fix-to-fix mode
-    if is_fix_identifier(first_arg) and is_fix_identifier(second_arg):
-        do_fix_descent(first_arg, second_arg)
-    else:
-        do_descent_calc(first_arg, second_arg)
+    from .commands import do_descent_calc, do_fix_descent
+    from .descent import is_fix_identifier
 
-
-@main.command("des", help=COMMAND_HELP["descent"].strip())
-@click.argument("first_arg")
-@click.argument("second_arg")
-def des(first_arg: str, second_arg: str):
-    # If both arguments are fix/airport/navaid identifiers, use fix-to-fix mode
     if is_fix_identifier(first_arg) and is_fix_identifier(second_arg):
         do_fix_descent(first_arg, second_arg)
     else:
         do_descent_calc(first_arg, second_arg)
 
 
-@main.command(help=COMMAND_HELP["distance"].strip())
+@main.command(help=COMMAND_HELP["distance"])
 @click.argument("from_ident")
 @click.argument("to_ident")
 def distance(from_ident: str, to_ident: str):
+    from .distance import compute_distance
+
     try:
         result = compute_distance(from_ident, to_ident)
     except ValueError as exc:
@@ -303,10 +280,12 @@ def distance(from_ident: str, to_ident: str):
     click.echo(f"Bearing:  {result.bearing_deg:.1f}° {result.cardinal}")
 
 
-@main.command(help=COMMAND_HELP["bearing"].strip())
+@main.command(help=COMMAND_HELP["bearing"])
 @click.argument("from_ident")
 @click.argument("to_ident")
 def bearing(from_ident: str, to_ident: str):
+    from .distance import compute_bearing
+
     try:
         result = compute_bearing(from_ident, to_ident)
     except ValueError as exc:
@@ -318,23 +297,17 @@ def bearing(from_ident: str, to_ident: str):
     click.echo(f"Distance: {result.distance_nm:.1f} NM")
 
 
-@main.command(help=COMMAND_HELP["approaches"].strip())
+@main.command(help=COMMAND_HELP["approaches"])
 @click.argument("airport", shell_complete=complete_airport)
 @click.argument("star_or_fix")
 @click.argument("runways", nargs=-1)
 def approaches(airport: str, star_or_fix: str, runways: tuple[str, ...]):
-    do_approaches_lookup(airport, star_or_fix, list(runways) if runways else None)
-
+    from .commands import do_approaches_lookup
 
-@main.command("apps", help=COMMAND_HELP["apps"].strip())
-@click.argument("airport", shell_complete=complete_airport)
-@click.argument("star_or_fix")
-@click.argument("runways", nargs=-1)
-def apps(airport: str, star_or_fix: str, runways: tuple[str, ...]):
     do_approaches_lookup(airport, star_or_fix, list(runways) if runways else None)
 
 
-@main.command(help=COMMAND_HELP["mea"].strip())
+@main.command(help=COMMAND_HELP["mea"])
 @click.argument("route", nargs=-1, required=True)
 @click.option(
     "--altitude",
@@ -344,21 +317,26 @@ def apps(airport: str, star_or_fix: str, runways: tuple[str, ...]):
     help="Altitude in hundreds of feet (e.g., 100 = 10,000 ft)",
 )
 def mea(route: tuple[str, ...], altitude: int | None):
+    from .commands import do_mea_lookup
+
     do_mea_lookup(" ".join(route), altitude)
 
 
-@main.command(help=COMMAND_HELP["cifp"].strip())
+@main.command(help=COMMAND_HELP["cifp"])
 @click.argument("airport", shell_complete=complete_airport)
 @click.argument("procedure", nargs=-1, required=True)
 def cifp(airport: str, procedure: tuple[str, ...]):
+    from .commands import do_cifp_lookup
+
     do_cifp_lookup(airport, " ".join(procedure))
 
 
-@main.command(help=COMMAND_HELP["uses"].strip())
+@main.command(help=COMMAND_HELP["uses"])
 @click.argument("fix", required=True)
 @click.argument("filters", nargs=-1)
 def uses(fix: str, filters: tuple[str, ...]):
     from .cifp import parse_uses_filters
+    from .commands import do_uses_lookup
 
     airport_filter, type_filter = parse_uses_filters(list(filters))
     do_uses_lookup(fix, airport_filter=airport_filter, type_filter=type_filter)
@@ -367,50 +345,52 @@ def uses(fix: str, filters: tuple[str, ...]):
 # --- Procedure/SOP Commands ---
 
 
-@main.command(help=COMMAND_HELP["sop"].strip())
+@main.command(help=COMMAND_HELP["sop"])
 @click.argument("query", nargs=-1, required=False, shell_complete=complete_sop_query)
 @click.option("--list", "list_procs", is_flag=True, help="List available procedures")
 @click.option("--no-cache", is_flag=True, help="Bypass cache and fetch fresh data")
 def sop(query: tuple[str, ...], list_procs: bool, no_cache: bool):
-    handle_sop_command(query or (), list_procs, no_cache)
-
+    from .commands import handle_sop_command
 
-@main.command("proc", help=COMMAND_HELP["proc"].strip())
-@click.argument("query", nargs=-1, required=False, shell_complete=complete_sop_query)
-@click.option("--list", "list_procs", is_flag=True, help="List available procedures")
-@click.option("--no-cache", is_flag=True, help="Bypass cache and fetch fresh data")
-def proc(query: tuple[str, ...], list_procs: bool, no_cache: bool):
     handle_sop_command(query or (), list_procs, no_cache)
 
 
-@main.command(help=COMMAND_HELP["metar"].strip())
+@main.command(help=COMMAND_HELP["metar"])
 @click.argument("stations", nargs=-1, required=True)
 def metar(stations: tuple[str, ...]):
+    from .commands import do_metar_lookup
+
     do_metar_lookup(list(stations))
 
 
-@main.command(help=COMMAND_HELP["atis"].strip())
+@main.command(help=COMMAND_HELP["atis"])
 @click.argument("airport", required=False, shell_complete=complete_atis_airport)
 @click.option(
     "--all", "-a", "show_all", is_flag=True, help="Show ATIS for all airports"
 )
 def atis(airport: str | None, show_all: bool):
+    from .commands import do_atis_lookup
+
     do_atis_lookup(airport, show_all=show_all)
 
 
-@main.command(help=COMMAND_HELP["vis"].strip())
+@main.command(help=COMMAND_HELP["vis"])
 def vis():
     """Open ZOA airspace visualizer."""
+    import webbrowser
+
     webbrowser.open(AIRSPACE_URL)
     click.echo("Opened airspace visualizer")
 
 
-@main.command(help=COMMAND_HELP["tdls"].strip())
+@main.command(help=COMMAND_HELP["tdls"])
 @click.argument(
     "facility", required=False, default=None, shell_complete=complete_facility
 )
 def tdls(facility: str | None):
     """Open TDLS (Pre-Departure Clearances)."""
+    import webbrowser
+
     if facility:
         url = f"{TDLS_URL}{facility.upper()}"
         webbrowser.open(url)
@@ -420,10 +400,12 @@ def tdls(facility: str | None):
         click.echo("Opened TDLS")
 
 
-@main.command(help=COMMAND_HELP["strips"].strip())
+@main.command(help=COMMAND_HELP["strips"])
 @click.argument("facility", required=False, shell_complete=complete_facility)
 def strips(facility: str | None):
     """Open flight strips."""
+    import webbrowser
+
     if facility:
         url = f"{STRIPS_URL}{facility.upper()}"
         webbrowser.open(url)
@@ -433,11 +415,13 @@ def strips(facility: str | None):
         click.echo("Opened flight strips")
 
 
-@main.command(help=COMMAND_HELP["vr"].strip())
+@main.command(help=COMMAND_HELP["vr"])
 @click.argument("airports", nargs=-1, shell_complete=complete_airport)
 @click.option("--zoom", "-z", type=int, default=None, help="Map zoom level")
 def vr(airports: tuple[str, ...], zoom: int | None):
     """Open VATSIM Radar centered on airport(s)."""
+    from .commands import do_vatsim_radar
+
     do_vatsim_radar(list(airports) if airports else None, zoom)
 
 
@@ -457,59 +441,79 @@ def help_cmd(ctx, command: str | None):
             click.echo(f"Unknown command: {command}")
             click.echo("Run 'zoa --help' to see available commands.")
     else:
-        # Show general help
-        click.echo("ZOA Reference CLI - Quick lookups to ZOA's Reference Tool.")
-        click.echo("Usage: zoa [--playwright] [command] [args...]\n")
-        print_interactive_help(include_misc=False)
-        click.echo("\nRun 'zoa help <command>' for detailed command help.")
+        # Show general help (the command list is prebuilt, so this is one write)
+        click.echo(
+            "ZOA Reference CLI - Quick lookups to ZOA's Reference Tool.\n"
+            "Usage: zoa [--playwright] [command] [args...]\n\n"
+            f"{format_interactive_help(include_misc=False)}\n\n"
+            "Run 'zoa help <command>' for detailed command help."
+        )
 
 
 # --- Position Commands ---
 
 
-@main.command(help=COMMAND_HELP["position"].strip())
+@main.command(help=COMMAND_HELP["position"])
 @click.argument("query", nargs=-1, required=True, shell_complete=complete_facility)
 @click.option("--browser", is_flag=True, help="Open browser instead of CLI display")
 @click.option("--no-cache", is_flag=True, help="Bypass cache and fetch fresh data")
 def position(query: tuple[str, ...], browser: bool, no_cache: bool):
-    do_position_lookup(" ".join(query), browser=browser, no_cache=no_cache)
-
+    from .commands import do_position_lookup
 
-@main.command("pos", help=COMMAND_HELP["pos"].strip())
-@click.argument("query", nargs=-1, required=True, shell_complete=complete_facility)
-@click.option("--browser", is_flag=True, help="Open browser instead of CLI display")
-@click.option("--no-cache", is_flag=True, help="Bypass cache and fetch fresh data")
-def pos(query: tuple[str, ...], browser: bool, no_cache: bool):
     do_position_lookup(" ".join(query), browser=browser, no_cache=no_cache)
 
 
 # --- Scratchpad Commands ---
 
 
-@main.command(help=COMMAND_HELP["scratchpad"].strip())
+@main.command(help=COMMAND_HELP["scratchpad"])
 @click.argument("facility", required=False, shell_complete=complete_facility)
 @click.option("--list", "list_facs", is_flag=True, help="List available facilities")
 @click.option("--no-cache", is_flag=True, help="Bypass cache and fetch fresh data")
 def scratchpad(facility: str | None, list_facs: bool, no_cache: bool):
+    from .commands import do_scratchpad_lookup
+
     do_scratchpad_lookup(facility, list_facs=list_facs, no_cache=no_cache)
 
 
-@main.command("scratch", help=COMMAND_HELP["scratch"].strip())
-@click.argument("facility", required=False, shell_complete=complete_facility)
-@click.option("--list", "list_facs", is_flag=True, help="List available facilities")
-@click.option("--no-cache", is_flag=True, help="Bypass cache and fetch fresh data")
-def scratch(facility: str | None, list_facs: bool, no_cache: bool):
-    do_scratchpad_lookup(facility, list_facs=list_facs, no_cache=no_cache)
+# --- Aliases ---
+
+# Each alias reuses its command's callback and parameters; only the name and,
+# where COMMAND_HELP has an entry for the alias, the help text differ
+_COMMAND_ALIASES = {
+    "al": "airline",
+    "ap": "airport",
+    "ac": "aircraft",
+    "aw": "airway",
+    "des": "descent",
+    "apps": "approaches",
+    "proc": "sop",
+    "pos": "position",
+    "scratch": "scratchpad",
+}
+
+for _alias, _name in _COMMAND_ALIASES.items():
+    _command = main.commands[_name]
+    main.add_command(
+        click.Command(
+            _alias,
+            callback=_command.callback,
+            params=_command.params,
+            help=COMMAND_HELP.get(_alias, _command.help),
+        )
+    )
 
 
-@main.command(help=COMMAND_HELP["setbrowser"].strip())
+@main.command(help=COMMAND_HELP["setbrowser"])
 @click.argument("browser", required=False)
 def setbrowser(browser: str | None):
     """Set preferred browser for opening charts."""
+    from .commands import do_setbrowser
+
     do_setbrowser(browser)
 
 
-@main.command(help=COMMAND_HELP["sethotkey"].strip())
+@main.command(help=COMMAND_HELP["sethotkey"])
 @click.argument("action", required=False)
 def sethotkey(action: str | None):
     """Set a global hotkey to focus this terminal (interactive mode only)."""
@@ -517,5 +521,24 @@ def sethotkey(action: str | None):
     click.echo("Run 'zoa' to enter interactive mode, then type 'sethotkey'.")
 
 
+@main.command("gen-completion")
+@click.argument("shell", type=click.Choice(["bash"]), default="bash")
+@click.option(
+    "--prog-name",
+    default="zoa",
+    show_default=True,
+    help="Executable to complete (e.g. zoa-reference-cli for the standalone binary)",
+)
+def gen_completion(shell: str, prog_name: str):
+    """Print a shell completion script with airport lists built in.
+
+    Unlike Click's generated completion, the script answers most <TAB>
+    presses without starting Python. Install it with, e.g.:
+
+        zoa gen-completion bash > ~/.local/share/bash-completion/completions/zoa
+    """
+    click.echo(generate_bash_completion(main, prog_name), nl=False)
+
+
 if __name__ == "__main__":
     main()
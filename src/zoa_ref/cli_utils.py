@@ -1,24 +1,36 @@
 """CLI utility functions, constants, and data classes."""
 
-import csv
-import io
 import os
 import shlex
+import shutil
 import subprocess
 import sys
 import time
-import webbrowser
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
+from playwright.sync_api import (
+    Error as PlaywrightError,
+    TimeoutError as PlaywrightTimeout,
+)
 
 if sys.platform == "win32":
+    import ctypes
     import msvcrt
 
+    # WaitForSingleObject results
+    _WAIT_OBJECT_0 = 0x00000000
+    _WAIT_TIMEOUT = 0x00000102
+
 from .browser import BrowserSession
 from .icao import CodesPage
 
+if TYPE_CHECKING:
+    from .processes import ProcessEntry
+
 
 # Browser process names mapped to their command names
 BROWSERS = {
@@ -29,52 +41,45 @@ BROWSERS = {
     "opera.exe": "opera",
 }
 
+# Last get_running_browser() answer as (monotonic time, browser command)
+_running_browser_memo: tuple[float, str | None] | None = None
+
+# How often to check for Enter while a browser window is open
+INPUT_POLL_INTERVAL_MS = 100
+
 # Valid browser choices for setbrowser command
 VALID_BROWSERS = ["chrome", "msedge", "firefox", "brave", "opera"]
+_VALID_BROWSER_SET = frozenset(VALID_BROWSERS)
 
 
-def _get_descendant_pids() -> set[int]:
+def _get_descendant_pids(processes: list["ProcessEntry"]) -> set[int]:
     """Get all PIDs that are descendants of the current process.
 
-    Uses wmic to build a parent->children map, then traverses from current PID.
-    Returns empty set on any error (fail open - better to detect browser than not).
+    Builds a parent->children map from the given process snapshot, then
+    traverses from the current PID.
     """
-    try:
-        result = subprocess.run(
-            ["wmic", "process", "get", "ProcessId,ParentProcessId", "/FORMAT:CSV"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode != 0:
-            return set()
-
-        # Build parent -> children map
-        parent_to_children: dict[int, list[int]] = {}
-        reader = csv.DictReader(io.StringIO(result.stdout))
-        for row in reader:
-            try:
-                pid = int(row.get("ProcessId", 0))
-                ppid = int(row.get("ParentProcessId", 0))
-                if ppid not in parent_to_children:
-                    parent_to_children[ppid] = []
-                parent_to_children[ppid].append(pid)
-            except (ValueError, TypeError):
-                continue
-
-        # BFS from current PID to find all descendants
-        current_pid = os.getpid()
-        descendants: set[int] = set()
-        queue = parent_to_children.get(current_pid, [])
-        while queue:
-            pid = queue.pop(0)
-            if pid not in descendants:
-                descendants.add(pid)
-                queue.extend(parent_to_children.get(pid, []))
-
-        return descendants
-    except Exception:
-        return set()
+    # Build parent -> children map
+    parent_to_children: dict[int, list[int]] = {}
+    for process in processes:
+        parent_to_children.setdefault(process.parent_pid, []).append(process.pid)
+
+    # BFS from current PID to find all descendants
+    current_pid = os.getpid()
+    descendants: set[int] = set()
+    queue = deque(parent_to_children.get(current_pid, ()))
+    while queue:
+        pid = queue.popleft()
+        if pid not in descendants:
+            descendants.add(pid)
+            queue.extend(parent_to_children.get(pid, []))
+
+    return descendants
+
+
+def _clear_running_browser_memo() -> None:
+    """Forget the last detected browser so the next lookup rescans."""
+    global _running_browser_memo
+    _running_browser_memo = None
 
 
 def get_browser_preference() -> str | None:
@@ -88,7 +93,7 @@ def get_browser_preference() -> str | None:
     try:
         if BROWSER_PREF_FILE.exists():
             browser = BROWSER_PREF_FILE.read_text().strip()
-            if browser in VALID_BROWSERS:
+            if browser in _VALID_BROWSER_SET:
                 return browser
     except Exception:
         pass
@@ -106,13 +111,14 @@ def set_browser_preference(browser: str) -> bool:
     """
     from .config import BROWSER_PREF_FILE
 
-    if browser.lower() not in VALID_BROWSERS:
+    if browser.lower() not in _VALID_BROWSER_SET:
         return False
 
     try:
         # Ensure parent directory exists
         BROWSER_PREF_FILE.parent.mkdir(parents=True, exist_ok=True)
         BROWSER_PREF_FILE.write_text(browser.lower())
+        _clear_running_browser_memo()
         return True
     except Exception:
         return False
@@ -129,6 +135,7 @@ def clear_browser_preference() -> bool:
     try:
         if BROWSER_PREF_FILE.exists():
             BROWSER_PREF_FILE.unlink()
+        _clear_running_browser_memo()
         return True
     except Exception:
         return False
@@ -176,6 +183,17 @@ INTERACTIVE_HELP_COMMANDS = [
     "  sethotkey [clear]         - Set global hotkey to focus this terminal",
 ]
 
+# Shown only inside interactive mode, after the command list
+INTERACTIVE_HELP_MISC = [
+    "Misc:",
+    "  help [command]            - Show help (e.g., help sop)",
+    "  quit|exit|q               - Exit the program",
+]
+
+# The help text never changes at runtime, so join it once at import
+_INTERACTIVE_HELP_TEXT = "\n".join(INTERACTIVE_HELP_COMMANDS + INTERACTIVE_HELP_MISC)
+_INTERACTIVE_HELP_TEXT_NO_MISC = "\n".join(INTERACTIVE_HELP_COMMANDS)
+
 # Detailed help for individual commands (used by "help <command>")
 COMMAND_HELP = {
     "chart": """
@@ -665,8 +683,18 @@ Examples:
 """,
 }
 
+# Strip the surrounding newlines once here rather than in every decorator
+COMMAND_HELP = {name: text.strip() for name, text in COMMAND_HELP.items()}
 
-@dataclass
+
+@dataclass(slots=True)
+class CliContext:
+    """Click context object (ctx.obj) shared with one-shot subcommands."""
+
+    playwright: bool = False
+
+
+@dataclass(slots=True)
 class InteractiveContext:
     """Context object for interactive mode state.
 
@@ -678,11 +706,15 @@ class InteractiveContext:
     use_playwright: bool
     visible_session: BrowserSession | None = field(default=None)
     hotkey_manager: object | None = field(default=None)
+    # ChartQuery -> (timestamp, lookup_chart_with_pages result), LRU ordered
+    chart_lookup_cache: OrderedDict = field(default_factory=OrderedDict)
 
     def get_or_create_visible_session(self) -> BrowserSession:
         """Get or create the visible browser session.
 
-        Creates a child session from headless_session if needed.
+        Creates a child session from headless_session on first use (or after
+        the user closed the window), so sessions that never open a chart
+        never launch a visible browser.
         """
         if self.visible_session is None:
             self.visible_session = self.headless_session.create_child_session(
@@ -709,18 +741,24 @@ class ParsedArgs:
     show_help: bool = False
 
 
+def format_interactive_help(include_misc: bool = True) -> str:
+    """Format interactive mode command help as one block of text.
+
+    Args:
+        include_misc: If True, include the misc section (help, quit).
+    """
+    if include_misc:
+        return _INTERACTIVE_HELP_TEXT
+    return _INTERACTIVE_HELP_TEXT_NO_MISC
+
+
 def print_interactive_help(include_misc: bool = True) -> None:
     """Print interactive mode command help.
 
     Args:
         include_misc: If True, include the misc section (help, quit).
     """
-    for line in INTERACTIVE_HELP_COMMANDS:
-        click.echo(line)
-    if include_misc:
-        click.echo("Misc:")
-        click.echo("  help [command]            - Show help (e.g., help sop)")
-        click.echo("  quit|exit|q               - Exit the program")
+    click.echo(format_interactive_help(include_misc))
 
 
 def print_command_help(command: str, main_group: click.Group) -> bool:
@@ -734,11 +772,12 @@ def print_command_help(command: str, main_group: click.Group) -> bool:
         True if help was found and printed, False otherwise.
     """
     cmd_lower = command.lower().strip()
-    # Get the Click command from the main group
-    ctx = click.Context(main_group)
-    cmd = main_group.get_command(ctx, cmd_lower)
+    # Plain registry lookup (all get_command does for a Group), so unknown
+    # names don't build a Context at all
+    cmd = main_group.commands.get(cmd_lower)
     if cmd is not None:
         # Create a context for the command and print its help
+        ctx = click.Context(main_group)
         with click.Context(cmd, info_name=cmd_lower, parent=ctx) as cmd_ctx:
             click.echo(cmd.get_help(cmd_ctx))
         return True
@@ -750,64 +789,101 @@ def get_running_browser() -> str | None:
 
     If multiple browsers are running, returns the one that was started most recently.
     Excludes browser processes that are descendants of the current process
-    (e.g., Playwright's Chromium instances).
+    (e.g., Playwright's Chromium instances). The answer is reused for
+    RUNNING_BROWSER_TTL_SECONDS, so opening several charts in a row scans
+    the process table once.
     """
+    from .config import RUNNING_BROWSER_TTL_SECONDS
+
+    global _running_browser_memo
+    now = time.monotonic()
+    if (
+        _running_browser_memo is not None
+        and now - _running_browser_memo[0] < RUNNING_BROWSER_TTL_SECONDS
+    ):
+        return _running_browser_memo[1]
+
+    browser = _detect_running_browser()
+    _running_browser_memo = (now, browser)
+    return browser
+
+
+def _detect_running_browser() -> str | None:
+    """Scan the process table for a running browser (see get_running_browser)."""
+    if sys.platform != "win32":
+        return None
+
     try:
-        # Get process list with creation time using WMIC
-        result = subprocess.run(
-            ["wmic", "process", "get", "Name,ProcessId,CreationDate", "/FORMAT:CSV"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
+        from .processes import get_process_creation_time, snapshot_processes
 
-        if result.returncode != 0:
+        # One snapshot serves both the browser match and the descendant walk
+        processes = snapshot_processes()
+
+        # Cheap pre-check on the exe names: if no known browser is running,
+        # skip the descendant-PID walk and the creation time queries.
+        candidates = [p for p in processes if p.name in BROWSERS]
+        if not candidates:
             return None
 
         # Get PIDs to exclude (Playwright browsers spawned by this process)
-        exclude_pids = _get_descendant_pids()
-
-        # Track browsers found with their creation times
-        browsers_found: list[tuple[str, str]] = []  # (browser_cmd, creation_date)
-
-        # Parse CSV output
-        reader = csv.DictReader(io.StringIO(result.stdout))
-        for row in reader:
-            try:
-                process_name = row.get("Name", "").lower()
-                pid = int(row.get("ProcessId", 0))
-                creation_date = row.get("CreationDate", "")
-
-                # Skip if this is a descendant of our process
-                if pid in exclude_pids:
-                    continue
-
-                # Check if this is a known browser
-                for browser_name, cmd in BROWSERS.items():
-                    if process_name == browser_name:
-                        browsers_found.append((cmd, creation_date))
-                        break
-            except (ValueError, TypeError, KeyError):
-                continue
-
-        if not browsers_found:
+        exclude_pids = _get_descendant_pids(processes)
+        candidates = [p for p in candidates if p.pid not in exclude_pids]
+
+        if not candidates:
             return None
 
-        # If only one browser found, return it
-        if len(browsers_found) == 1:
-            return browsers_found[0][0]
+        # If only one browser process found, return it
+        if len(candidates) == 1:
+            return BROWSERS[candidates[0].name]
 
-        # Multiple browsers - return the one with the latest creation date
-        # WMIC creation date format: YYYYMMDDHHMMss.mmmmmm+zzz
-        # Sort by creation date (descending) and return the newest
-        browsers_found.sort(key=lambda x: x[1], reverse=True)
-        return browsers_found[0][0]
+        # Multiple browser processes - return the most recently started one.
+        # Creation times are only queried for these few candidates, not for
+        # every process in the snapshot.
+        newest = max(candidates, key=lambda p: get_process_creation_time(p.pid))
+        return BROWSERS[newest.name]
 
     except Exception:
         pass
     return None
 
 
+# Resolved browser executables; only hits are kept, so a browser installed
+# mid-session is still found on the next chart open
+_browser_paths: dict[str, str] = {}
+
+
+def _resolve_browser_path(browser_cmd: str) -> str | None:
+    """Resolve a browser command name to its executable path (Windows).
+
+    Chrome, Edge and the other browsers register themselves under the
+    "App Paths" registry key rather than on PATH, which is how cmd's
+    `start chrome` finds them, so that key is checked first (per-user, then
+    machine-wide), then PATH.
+    """
+    if browser_cmd in _browser_paths:
+        return _browser_paths[browser_cmd]
+
+    import winreg
+
+    subkey = rf"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths\{browser_cmd}.exe"
+    path = None
+    for root in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+        try:
+            with winreg.OpenKey(root, subkey) as key:
+                value = os.path.expandvars(winreg.QueryValue(key, None).strip('"'))
+        except OSError:
+            continue
+        if value and os.path.isfile(value):
+            path = value
+            break
+    if path is None:
+        path = shutil.which(browser_cmd)
+
+    if path:
+        _browser_paths[browser_cmd] = path
+    return path
+
+
 def open_in_browser(
     file_path: str, view: str = "FitV", page: int | None = None
 ) -> bool:
@@ -821,6 +897,8 @@ def open_in_browser(
     Returns:
         True if opened successfully.
     """
+    import webbrowser
+
     # Convert to proper file:// URI with fragment
     file_uri = Path(file_path).as_uri()
     fragments = []
@@ -842,10 +920,16 @@ def open_in_browser(
 
     if browser_cmd:
         try:
-            if sys.platform == "win32":
-                # On Windows, cmd's `start` resolves registered browser names
-                # like "chrome" / "msedge" via App Paths without needing a full
-                # path. The first "" is the mandatory window-title placeholder.
+            browser_path = (
+                _resolve_browser_path(browser_cmd) if sys.platform == "win32" else None
+            )
+            if browser_path:
+                # Found via App Paths or PATH: launch it directly, skipping
+                # the cmd.exe hop and its '&' quoting rules.
+                subprocess.Popen([browser_path, file_uri], close_fds=True)
+            elif sys.platform == "win32":
+                # Otherwise let cmd's `start` try to resolve the browser name.
+                # The first "" is the mandatory window-title placeholder.
                 # cmd.exe treats '&' as a command separator, and
                 # subprocess.list2cmdline only quotes arguments containing
                 # whitespace, so unquoted URL fragments like
@@ -902,11 +986,16 @@ def parse_interactive_args(
     options: dict[str, str] = {}
     show_help = False
 
-    try:
-        parts = shlex.split(args)
-    except ValueError:
-        # Handle unclosed quotes gracefully
-        parts = args.strip().split()
+    if '"' in args or "'" in args or "\\" in args:
+        try:
+            parts = shlex.split(args)
+        except ValueError:
+            # Handle unclosed quotes gracefully
+            parts = args.split()
+    else:
+        # Without quotes or escapes shlex splits on whitespace only, so
+        # skip building its lexer for the common case
+        parts = args.split()
     i = 0
     while i < len(parts):
         part = parts[i]
@@ -931,26 +1020,37 @@ def parse_interactive_args(
     )
 
 
-def is_page_alive(page) -> bool:
-    """Check if a page is still alive by attempting a simple operation."""
-    try:
-        page.evaluate("1")
-        return True
-    except Exception:
-        return False
-
+def _has_input_ready(timeout: float = 0) -> bool:
+    """Check if input is available, waiting up to timeout seconds for it.
 
-def _has_input_ready() -> bool:
-    """Check if input is available without blocking.
+    On POSIX the wait is a select() on stdin, so it returns as soon as the
+    user presses Enter. Windows consoles can't be selected on, so there the
+    wait is on the console input handle, which is signaled by any console
+    event. Non-key events (focus, mouse) stay queued and would keep it
+    signaled, so if one wakes the wait it falls back to sleeping out the
+    timeout rather than spinning.
 
     Returns True if there's input ready to read (user pressed a key).
     """
     if sys.platform == "win32":
+        if msvcrt.kbhit():
+            return True
+        if timeout > 0:
+            handle = ctypes.c_void_p(msvcrt.get_osfhandle(sys.stdin.fileno()))
+            result = ctypes.windll.kernel32.WaitForSingleObject(
+                handle, int(timeout * 1000)
+            )
+            if result == _WAIT_OBJECT_0 and msvcrt.kbhit():
+                return True
+            if result != _WAIT_TIMEOUT:
+                # Woken by a non-key event, or the wait failed (stdin isn't
+                # a console)
+                time.sleep(timeout)
         return msvcrt.kbhit()
     else:
         import select
 
-        return bool(select.select([sys.stdin], [], [], 0)[0])
+        return bool(select.select([sys.stdin], [], [], timeout)[0])
 
 
 def _consume_line() -> None:
@@ -976,25 +1076,37 @@ def wait_for_input_or_close(
     in a background thread, which can interfere with prompt_toolkit when
     returning to interactive mode.
 
+    Each tick is split between two waits that each wake immediately on
+    their own event: a select() on stdin (Enter), then Playwright waiting for
+    the page's close event, which also lets it deliver browser disconnect
+    events. Neither wait sends a request to the browser.
+
     Returns True if browser/page was closed by user, False if Enter was pressed.
     """
     click.echo(prompt)
+    half_tick_ms = INPUT_POLL_INTERVAL_MS / 2
 
     while True:
-        # Check if browser disconnected or page was closed
-        if not session.is_connected:
-            click.echo("\nBrowser closed.")
-            return True
-        if page is not None and not is_page_alive(page):
+        # Check if browser disconnected or page was closed (both tracked
+        # locally by Playwright from the events it has received)
+        if not session.is_connected or (page is not None and page.is_closed()):
             click.echo("\nBrowser closed.")
             return True
 
-        # Check for keyboard input (non-blocking)
-        if _has_input_ready():
+        # Wait briefly for keyboard input
+        if _has_input_ready(timeout=half_tick_ms / 1000):
             _consume_line()
             return False
 
-        time.sleep(0.1)
+        if page is None:
+            continue
+        try:
+            page.wait_for_event("close", timeout=half_tick_ms)
+        except PlaywrightTimeout:
+            pass
+        except PlaywrightError:
+            # Browser went away mid-wait; the checks above report it
+            pass
 
 
 class ImplicitChartGroup(click.Group):
@@ -1004,8 +1116,9 @@ class ImplicitChartGroup(click.Group):
         """Parse args, treating unknown commands as chart queries."""
         # Check if we have args and the first arg isn't a known command or option
         if args and not args[0].startswith("-"):
-            cmd_name = args[0]
-            if self.get_command(ctx, cmd_name) is None:
+            # The registry dict already answers "is this a command?" in one
+            # lookup; no separate name set to keep in sync
+            if args[0] not in self.commands:
                 # Not a known command - check for "AIRPORT sop/proc" pattern
                 # If second arg is "sop" or "proc" (case-insensitive), treat as sop command
                 if len(args) >= 2 and args[1].lower() in ("sop", "proc"):
@@ -1019,10 +1132,12 @@ class ImplicitChartGroup(click.Group):
 
     def format_help(self, ctx, formatter):
         """Write the same help as interactive mode."""
-        click.echo("ZOA Reference CLI - Quick lookups to ZOA's Reference Tool.")
-        click.echo("Usage: zoa [--playwright] [command] [args...]\n")
-        print_interactive_help(include_misc=False)
-        click.echo("\nRun 'zoa <command> --help' for detailed command help.")
+        click.echo(
+            "ZOA Reference CLI - Quick lookups to ZOA's Reference Tool.\n"
+            "Usage: zoa [--playwright] [command] [args...]\n\n"
+            f"{format_interactive_help(include_misc=False)}\n\n"
+            "Run 'zoa <command> --help' for detailed command help."
+        )
 
 
 def set_console_title(title: str) -> None:
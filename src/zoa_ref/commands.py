@@ -1,13 +1,27 @@
 """Shared command implementations for CLI and interactive modes."""
 
 import re
-import webbrowser
+import time
+from collections import OrderedDict
 from collections.abc import Callable
+from pathlib import Path
+from typing import TypeVar
 
 import click
-
-from .atis import fetch_atis, fetch_all_atis, ATIS_AIRPORTS
-from .cache import get_airac_for_caching, get_processed_pdf_path
+from playwright.sync_api import Page
+
+from .atis import (
+    AtisResult,
+    fetch_atis,
+    fetch_all_atis,
+    ATIS_AIRPORT_SET,
+    ATIS_AIRPORTS_DISPLAY,
+)
+from .cache import (
+    get_airac_for_caching,
+    get_processed_chart_pdf_path,
+    get_processed_pdf_path,
+)
 from .frequency import record_airport
 from .browser import BrowserSession, _calculate_viewport_size
 from .charts import (
@@ -29,6 +43,12 @@ from .charts import (
     strip_pdf_metadata,
 )
 from .cli_utils import open_in_browser, wait_for_input_or_close
+from .config import (
+    ATIS_MEMO_TTL_SECONDS,
+    CHART_LOOKUP_CACHE_SIZE,
+    CHART_LOOKUP_TTL_SECONDS,
+    ROUTES_MEMO_TTL_SECONDS,
+)
 from .descent import calculate_descent, calculate_fix_descent
 from .display import (
     display_routes,
@@ -73,6 +93,11 @@ from .procedures import (
 from .routes import search_routes, open_routes_browser
 from .scratchpads import get_scratchpads, list_facilities
 
+T = TypeVar("T")
+
+# Recent route and ATIS scrapes: key -> (timestamp, result)
+_scrape_memo: dict[tuple[str, ...], tuple[float, object]] = {}
+
 
 def prompt_procedure_choice(matches: list[ProcedureMatch]) -> ProcedureInfo | None:
     """Prompt user to select from numbered matches."""
@@ -215,6 +240,8 @@ def open_procedure_pdf(procedure: ProcedureInfo, page_num: int = 1) -> None:
             open_in_browser(str(cache_path), view="FitV")
     else:
         # Fall back to opening URL directly
+        import webbrowser
+
         click.echo("Failed to download, opening URL directly...", err=True)
         pdf_url = procedure.full_url
         if page_num > 1:
@@ -224,6 +251,14 @@ def open_procedure_pdf(procedure: ProcedureInfo, page_num: int = 1) -> None:
         webbrowser.open(url_with_page)
 
 
+def _is_processed_pdf_cached(cache_path: Path) -> bool:
+    """Check whether a processed chart PDF from an earlier lookup can be reused."""
+    try:
+        return cache_path.stat().st_size > 0
+    except OSError:
+        return False
+
+
 def open_chart_pdf(
     pdf_urls: list[str],
     airport: str,
@@ -272,9 +307,11 @@ def open_chart_pdf(
         # System browser mode: download, optionally rotate, and open
         filename = sanitize_chart_filename(airport, chart_name)
         airac = get_airac_for_caching(pdf_url)
-        cache_path = get_processed_pdf_path(filename, airac)
+        cache_path = get_processed_chart_pdf_path(filename, pdf_urls, rotation, airac)
 
-        if download_and_rotate_pdf(pdf_url, str(cache_path), rotation):
+        if _is_processed_pdf_cached(cache_path) or download_and_rotate_pdf(
+            pdf_url, str(cache_path), rotation
+        ):
             view_mode = detect_pdf_view_mode(str(cache_path))
             click.echo(f"Opening chart: {chart_name}")
             if page_num:
@@ -283,6 +320,8 @@ def open_chart_pdf(
             return str(cache_path)
         else:
             click.echo("Failed to download chart", err=True)
+            import webbrowser
+
             # Fall back to opening URL directly (no rotation)
             fragment = "zoom=FitV&view=FitV"
             if page_num:
@@ -290,14 +329,25 @@ def open_chart_pdf(
             webbrowser.open(f"{pdf_url}#{fragment}")
             return pdf_url
     else:
-        # Multi-page chart - merge pages
-        click.echo(f"Chart has {num_pages} pages, merging...")
-
+        # Multi-page chart - merge pages (reusing a previous merge if present)
         filename = sanitize_chart_filename(airport, chart_name)
         airac = get_airac_for_caching(pdf_urls[0])
-        cache_path = get_processed_pdf_path(filename, airac)
+        cache_path = get_processed_chart_pdf_path(filename, pdf_urls, rotation, airac)
+
+        if session is not None:
+            # Playwright mode: the merged file's path identifies the chart (and
+            # rotation), so an open tab for it can be reused without re-merging
+            existing = session.find_page_by_url(cache_path.as_uri())
+            if existing is not None:
+                existing.bring_to_front()
+                click.echo(f"Chart already open: {chart_name}")
+                return str(cache_path)
 
-        if download_and_merge_pdfs(pdf_urls, str(cache_path), rotation):
+        is_cached = _is_processed_pdf_cached(cache_path)
+        if not is_cached:
+            click.echo(f"Chart has {num_pages} pages, merging...")
+
+        if is_cached or download_and_merge_pdfs(pdf_urls, str(cache_path), rotation):
             view_mode = detect_pdf_view_mode(str(cache_path))
             if session is not None:
                 # Playwright mode
@@ -316,10 +366,73 @@ def open_chart_pdf(
                 if not was_existing:
                     page.goto(f"{pdf_url}#zoom=FitV&view=FitV")
             else:
+                import webbrowser
+
                 webbrowser.open(f"{pdf_url}#zoom=FitV&view=FitV")
             return pdf_url
 
 
+def _fetch_with_headless_page(
+    fetch: Callable[[Page | None], T],
+    headless_session: "BrowserSession | None",
+    use_cache: bool = True,
+) -> T:
+    """Run a scrape function, starting a browser only when it needs a page.
+
+    The scrapers accept page=None when a cache hit is expected, so with
+    use_cache the cache is tried first and a warm lookup never launches
+    Chromium. On a miss, the shared headless session is used when given
+    (interactive mode); otherwise a session is started for this call.
+
+    Args:
+        fetch: Scrape function taking a page (or None for cache-only)
+        headless_session: Shared headless session (interactive mode)
+        use_cache: Whether to try a cache-only call first
+
+    Returns:
+        Whatever fetch returns.
+    """
+    if use_cache:
+        result = fetch(None)
+        if result:
+            return result
+
+    if headless_session is not None:
+        with headless_session.borrow_page() as page:
+            return fetch(page)
+
+    with BrowserSession(headless=True, block_resources=True) as session:
+        return fetch(session.new_page())
+
+
+def _memoized_scrape(
+    key: tuple[str, ...], ttl: float, scrape: Callable[[], T | None]
+) -> T | None:
+    """Return a recent result for key, or run scrape and remember it.
+
+    Used for pages that aren't cached on disk (routes, ATIS), so repeating
+    a lookup within ttl seconds skips the browser entirely. Failed scrapes
+    (None or empty) are not remembered.
+
+    Args:
+        key: Identifies the lookup, e.g. ("atis", "SFO")
+        ttl: How long a result stays valid, in seconds
+        scrape: Performs the lookup when there is no fresh result
+
+    Returns:
+        The remembered or freshly scraped result.
+    """
+    now = time.monotonic()
+    entry = _scrape_memo.get(key)
+    if entry is not None and now - entry[0] < ttl:
+        return entry[1]  # type: ignore[return-value]
+
+    result = scrape()
+    if result:
+        _scrape_memo[key] = (now, result)
+    return result
+
+
 def list_procedures(
     no_cache: bool = False,
     headless_session: "BrowserSession | None" = None,
@@ -332,21 +445,11 @@ def list_procedures(
     """
     click.echo("Fetching procedures list...")
 
-    own_session = headless_session is None
-    if own_session:
-        session = BrowserSession(headless=True)
-        session.start()
-    else:
-        session = headless_session
-
-    try:
-        page = session.new_page()
-        by_category = list_all_procedures(page, use_cache=not no_cache)
-        if headless_session is not None:
-            page.close()
-    finally:
-        if own_session:
-            session.stop()
+    by_category = _fetch_with_headless_page(
+        lambda page: list_all_procedures(page, use_cache=not no_cache),
+        headless_session,
+        use_cache=not no_cache,
+    )
 
     if not by_category:
         click.echo("Failed to fetch procedures list.", err=True)
@@ -433,21 +536,11 @@ def handle_sop_command(
         click.echo(f"  Search for: {parsed.search_term}")
 
     # Fetch procedures (cached)
-    own_session = headless_session is None
-    if own_session:
-        session = BrowserSession(headless=True)
-        session.start()
-    else:
-        session = headless_session
-
-    try:
-        page = session.new_page()
-        procedures = fetch_procedures_list(page, use_cache=not no_cache)
-        if headless_session is not None:
-            page.close()
-    finally:
-        if own_session:
-            session.stop()
+    procedures = _fetch_with_headless_page(
+        lambda page: fetch_procedures_list(page, use_cache=not no_cache),
+        headless_session,
+        use_cache=not no_cache,
+    )
 
     if not procedures:
         click.echo("Failed to fetch procedures list.", err=True)
@@ -599,24 +692,17 @@ def do_icao_lookup(
                     click.echo(f"Failed to retrieve {search_label} codes.", err=True)
             else:
                 click.echo(f"Failed to retrieve {search_label} codes.", err=True)
-        elif headless_session is not None:
-            # Use provided headless session
-            page = headless_session.new_page()
-            result = search_func(page, query, use_cache=not no_cache)
-            page.close()
+        else:
+            # The cache was already tried above, so go straight to a page
+            result = _fetch_with_headless_page(
+                lambda page: search_func(page, query, use_cache=not no_cache),
+                headless_session,
+                use_cache=False,
+            )
             if result:
                 display_func(result)
             else:
                 click.echo(f"Failed to retrieve {search_label} codes.", err=True)
-        else:
-            # Create own session
-            with BrowserSession(headless=True) as session:
-                page = session.new_page()
-                result = search_func(page, query, use_cache=not no_cache)
-                if result:
-                    display_func(result)
-                else:
-                    click.echo(f"Failed to retrieve {search_label} codes.", err=True)
 
 
 def do_route_lookup(
@@ -672,33 +758,24 @@ def do_route_lookup(
             # Always stop the session - it was created specifically for this command
             session.stop()
     else:
-        # CLI mode: scrape and display
-        own_session = headless_session is None
-        if own_session:
-            with BrowserSession(headless=True) as session:
-                page = session.new_page()
-                result = search_routes(page, departure, arrival)
-                if result:
-                    display_routes(
-                        result,
-                        max_real_world=None if show_all else top_n,
-                        show_flights=show_flights,
-                    )
-                else:
-                    click.echo("Failed to retrieve routes.", err=True)
+        # CLI mode: scrape and display (routes are only memoized briefly)
+        result = _memoized_scrape(
+            ("routes", departure, arrival),
+            ROUTES_MEMO_TTL_SECONDS,
+            lambda: _fetch_with_headless_page(
+                lambda page: search_routes(page, departure, arrival),
+                headless_session,
+                use_cache=False,
+            ),
+        )
+        if result:
+            display_routes(
+                result,
+                max_real_world=None if show_all else top_n,
+                show_flights=show_flights,
+            )
         else:
-            assert headless_session is not None
-            page = headless_session.new_page()
-            result = search_routes(page, departure, arrival)
-            page.close()
-            if result:
-                display_routes(
-                    result,
-                    max_real_world=None if show_all else top_n,
-                    show_flights=show_flights,
-                )
-            else:
-                click.echo("Failed to retrieve routes.", err=True)
+            click.echo("Failed to retrieve routes.", err=True)
 
 
 def do_atis_lookup(
@@ -714,47 +791,55 @@ def do_atis_lookup(
         headless_session: Shared headless session (interactive mode)
     """
     if not airport and not show_all:
-        click.echo(f"Available airports: {', '.join(ATIS_AIRPORTS)}")
+        click.echo(f"Available airports: {ATIS_AIRPORTS_DISPLAY}")
         click.echo("Error: Please specify an airport or use --all/-a", err=True)
         return
 
     click.echo("Fetching ATIS...")
 
-    own_session = headless_session is None
-    if own_session:
-        session = BrowserSession(headless=True)
-        session.start()
-    else:
-        session = headless_session
-
-    try:
-        page = session.new_page()
+    if show_all:
 
-        if show_all:
-            result = fetch_all_atis(page)
-            if result and result.atis_list:
-                display_atis(result.atis_list)
-            else:
-                click.echo("Failed to retrieve ATIS.", err=True)
-        elif airport:
-            airport = airport.upper()
-            record_airport(airport)
-            if airport not in ATIS_AIRPORTS:
-                click.echo(f"Warning: {airport} is not a known ATIS airport")
-                click.echo(f"Available airports: {', '.join(ATIS_AIRPORTS)}")
-                return
+        def scrape_all() -> AtisResult | None:
+            result = _fetch_with_headless_page(
+                fetch_all_atis, headless_session, use_cache=False
+            )
+            # An empty list means the page didn't render; don't remember it
+            if not result or not result.atis_list:
+                return None
+            # Every airport comes from the same page, so this one scrape
+            # also answers single-airport lookups for the next little while
+            now = time.monotonic()
+            for info in result.atis_list:
+                _scrape_memo[("atis", info.airport)] = (now, info)
+            return result
+
+        result = _memoized_scrape(("atis",), ATIS_MEMO_TTL_SECONDS, scrape_all)
+        if result and result.atis_list:
+            display_atis(result.atis_list)
+        else:
+            click.echo("Failed to retrieve ATIS.", err=True)
+        return
 
-            atis_info = fetch_atis(page, airport)
-            if atis_info:
-                display_atis([atis_info])
-            else:
-                click.echo(f"Failed to retrieve ATIS for {airport}.", err=True)
+    assert airport is not None
+    airport = airport.upper()
+    record_airport(airport)
+    # Reject unknown airports before starting a browser for them
+    if airport not in ATIS_AIRPORT_SET:
+        click.echo(f"Warning: {airport} is not a known ATIS airport")
+        click.echo(f"Available airports: {ATIS_AIRPORTS_DISPLAY}")
+        return
 
-        if headless_session is not None:
-            page.close()
-    finally:
-        if own_session:
-            session.stop()
+    atis_info = _memoized_scrape(
+        ("atis", airport),
+        ATIS_MEMO_TTL_SECONDS,
+        lambda: _fetch_with_headless_page(
+            lambda page: fetch_atis(page, airport), headless_session, use_cache=False
+        ),
+    )
+    if atis_info:
+        display_atis([atis_info])
+    else:
+        click.echo(f"Failed to retrieve ATIS for {airport}.", err=True)
 
 
 def do_metar_lookup(stations: list[str]) -> None:
@@ -888,11 +973,45 @@ def _handle_category_lookup(
     return None
 
 
+def _lookup_chart_cached(
+    parsed: ChartQuery, lookup_cache: OrderedDict | None
+) -> tuple[list[str] | None, ChartInfo | None, list[ChartMatch]]:
+    """Run lookup_chart_with_pages, reusing a recent result when available.
+
+    Args:
+        parsed: The parsed chart query (hashable, used as the cache key)
+        lookup_cache: LRU-ordered dict of query -> (timestamp, result), or None
+                      to always hit the API
+
+    Returns:
+        Same tuple as lookup_chart_with_pages.
+    """
+    if lookup_cache is None:
+        return lookup_chart_with_pages(parsed)
+
+    now = time.monotonic()
+    entry = lookup_cache.get(parsed)
+    if entry is not None and now - entry[0] < CHART_LOOKUP_TTL_SECONDS:
+        lookup_cache.move_to_end(parsed)
+        return entry[1]
+
+    result = lookup_chart_with_pages(parsed)
+    pdf_urls, _, matches = result
+    # Don't remember empty results; they're usually a transient API failure
+    if pdf_urls or matches:
+        lookup_cache[parsed] = (now, result)
+        lookup_cache.move_to_end(parsed)
+        while len(lookup_cache) > CHART_LOOKUP_CACHE_SIZE:
+            lookup_cache.popitem(last=False)
+    return result
+
+
 def do_chart_lookup(
     query_str: str,
     link_only: bool = False,
     rotation: int | None = None,
     visible_session: "BrowserSession | None" = None,
+    lookup_cache: OrderedDict | None = None,
 ) -> str | None:
     """Shared chart lookup using API.
 
@@ -902,12 +1021,14 @@ def do_chart_lookup(
         rotation: Rotation angle in degrees (0, 90, 180, 270).
                   If None, auto-detects from text orientation.
         visible_session: Playwright session for tab management (interactive mode)
+        lookup_cache: Per-session lookup memo (interactive mode); see
+                      _lookup_chart_cached
 
     Returns the PDF URL if found, None otherwise.
     """
     # Check if the query is a category code (e.g., APD, HOT, MIN) BEFORE parsing
     # This avoids normalization transforming category codes (e.g., HOT -> HOT SPRINGS)
-    query_parts = query_str.strip().upper().split()
+    query_parts = query_str.upper().split()
     if len(query_parts) >= 2:
         airport = query_parts[0]
         raw_chart_term = " ".join(query_parts[1:])
@@ -923,7 +1044,7 @@ def do_chart_lookup(
             )
 
     try:
-        parsed = ChartQuery.parse(query_str)
+        parsed = ChartQuery.from_parts(query_parts)
         record_airport(parsed.airport)
         click.echo(f"Looking up: {parsed.airport} - {parsed.chart_name}")
         if parsed.chart_type.value != "unknown":
@@ -932,7 +1053,7 @@ def do_chart_lookup(
         click.echo(f"Error: {e}", err=True)
         return None
 
-    pdf_urls, matched_chart, matches = lookup_chart_with_pages(parsed)
+    pdf_urls, matched_chart, matches = _lookup_chart_cached(parsed, lookup_cache)
 
     if pdf_urls and matched_chart:
         chart_name = matched_chart.chart_name
@@ -1007,6 +1128,26 @@ def do_chart_lookup(
     return None
 
 
+# Installed as a page init script for the charts browser: every embedded chart
+# PDF (including ones the user clicks to afterwards) is opened fit-to-height.
+# Registered once per page, so the browser parses it once for the page's life.
+_FIT_EMBEDDED_PDF_INIT_JS = """(() => {
+    const fitPdfs = () => {
+        for (const obj of document.querySelectorAll('object[data*=".PDF"]')) {
+            if (obj.data && !obj.data.includes('#')) {
+                obj.data = obj.data + '#zoom=FitV&view=FitV';
+            }
+        }
+    };
+    new MutationObserver(fitPdfs).observe(document, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        attributeFilter: ['data'],
+    });
+})();"""
+
+
 def do_charts_browse(
     query_str: str,
     visible_session: "BrowserSession | None" = None,
@@ -1036,16 +1177,12 @@ def do_charts_browse(
 
     try:
         page = session.new_page()
+        # Fit embedded PDFs to height as they appear, without a post-load
+        # evaluate round-trip
+        page.add_init_script(_FIT_EMBEDDED_PDF_INIT_JS)
         pdf_url = lookup_chart(page, parsed)
 
         if pdf_url:
-            # Modify the embedded PDF to fit to height
-            page.evaluate("""() => {
-                const obj = document.querySelector('object[data*=".PDF"]');
-                if (obj && obj.data && !obj.data.includes('#')) {
-                    obj.data = obj.data + '#zoom=FitV&view=FitV';
-                }
-            }""")
             click.echo("Chart found! Browse other charts in the browser window.")
         else:
             click.echo("Could not find chart. Browse manually in the browser window.")
@@ -1103,24 +1240,15 @@ def do_position_lookup(
             session.stop()
     else:
         # CLI mode: search and display
-        own_session = headless_session is None
-        if own_session:
-            with BrowserSession(headless=True) as session:
-                page = session.new_page()
-                result = search_positions(page, query, use_cache=not no_cache)
-                if result:
-                    display_positions(result)
-                else:
-                    click.echo("Failed to retrieve positions.", err=True)
+        result = _fetch_with_headless_page(
+            lambda page: search_positions(page, query, use_cache=not no_cache),
+            headless_session,
+            use_cache=not no_cache,
+        )
+        if result:
+            display_positions(result)
         else:
-            assert headless_session is not None
-            page = headless_session.new_page()
-            result = search_positions(page, query, use_cache=not no_cache)
-            page.close()
-            if result:
-                display_positions(result)
-            else:
-                click.echo("Failed to retrieve positions.", err=True)
+            click.echo("Failed to retrieve positions.", err=True)
 
 
 def do_scratchpad_lookup(
@@ -1140,24 +1268,15 @@ def do_scratchpad_lookup(
     if list_facs:
         click.echo("Fetching available facilities...")
 
-        own_session = headless_session is None
-        if own_session:
-            with BrowserSession(headless=True) as session:
-                page = session.new_page()
-                facilities = list_facilities(page, use_cache=not no_cache)
-                if facilities:
-                    display_scratchpad_facilities(facilities)
-                else:
-                    click.echo("Failed to retrieve facilities list.", err=True)
+        facilities = _fetch_with_headless_page(
+            lambda page: list_facilities(page, use_cache=not no_cache),
+            headless_session,
+            use_cache=not no_cache,
+        )
+        if facilities:
+            display_scratchpad_facilities(facilities)
         else:
-            assert headless_session is not None
-            page = headless_session.new_page()
-            facilities = list_facilities(page, use_cache=not no_cache)
-            page.close()
-            if facilities:
-                display_scratchpad_facilities(facilities)
-            else:
-                click.echo("Failed to retrieve facilities list.", err=True)
+            click.echo("Failed to retrieve facilities list.", err=True)
         return
 
     if not facility:
@@ -1168,24 +1287,15 @@ def do_scratchpad_lookup(
     record_airport(facility)
     click.echo(f"Fetching scratchpads for: {facility}...")
 
-    own_session = headless_session is None
-    if own_session:
-        with BrowserSession(headless=True) as session:
-            page = session.new_page()
-            result = get_scratchpads(page, facility, use_cache=not no_cache)
-            if result:
-                display_scratchpads(result)
-            else:
-                click.echo("Failed to retrieve scratchpads.", err=True)
+    result = _fetch_with_headless_page(
+        lambda page: get_scratchpads(page, facility, use_cache=not no_cache),
+        headless_session,
+        use_cache=not no_cache,
+    )
+    if result:
+        display_scratchpads(result)
     else:
-        assert headless_session is not None
-        page = headless_session.new_page()
-        result = get_scratchpads(page, facility, use_cache=not no_cache)
-        page.close()
-        if result:
-            display_scratchpads(result)
-        else:
-            click.echo("Failed to retrieve scratchpads.", err=True)
+        click.echo("Failed to retrieve scratchpads.", err=True)
 
 
 def do_navaid_lookup(query: str) -> None:
@@ -1472,19 +1582,21 @@ def do_list_charts(
 
     if charts_list:
         if search_term:
-            click.echo(f"\nCharts containing '{search_term}':")
+            title = f"\nCharts containing '{search_term}':"
         elif filter_type:
-            click.echo(f"\n{filter_type} charts for {airport}:")
+            title = f"\n{filter_type} charts for {airport}:"
         else:
-            click.echo(f"\nAvailable charts for {airport}:")
-        click.echo("-" * 40)
-        for chart_info in charts_list:
-            if filter_type:
-                # When filtered by type, don't show the type prefix
-                click.echo(f"  {chart_info.chart_name}")
-            else:
-                type_str = chart_info.chart_code if chart_info.chart_code else "?"
-                click.echo(f"  [{type_str:<4}] {chart_info.chart_name}")
+            title = f"\nAvailable charts for {airport}:"
+        lines = [title, "-" * 40]
+        if filter_type:
+            # When filtered by type, don't show the type prefix
+            lines.extend(f"  {c.chart_name}" for c in charts_list)
+        else:
+            lines.extend(
+                f"  [{c.chart_code or '?':<4}] {c.chart_name}" for c in charts_list
+            )
+        # One write for the whole listing; busy airports have 100+ charts
+        click.echo("\n".join(lines))
     else:
         if search_term and filter_type:
             click.echo(
@@ -1794,6 +1906,8 @@ def do_vatsim_radar(airports: list[str] | None, zoom: int | None) -> None:
         airports: Airport identifiers to center on (e.g., ["SFO"] or ["SMF", "RNO"]).
         zoom: Optional zoom level for the map.
     """
+    import webbrowser
+
     from .config import VATSIM_RADAR_URL
     from .waypoints import (
         WaypointInfo,
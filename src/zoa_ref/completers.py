@@ -4,13 +4,13 @@ These functions are used with Click's shell_complete parameter to provide
 tab completion in bash/zsh/powershell for CLI arguments.
 """
 
+import click
 from click import Context, Parameter
 from click.shell_completion import CompletionItem
 
 from .atis import ATIS_AIRPORTS
 from .cache import get_cached_chart_list
 from .charts import ZOA_AIRPORTS
-from .commands import CHART_TYPE_ALIASES, VALID_CHART_TYPES
 from .navaids import get_all_identifiers
 from .procedures import CLASS_D_AIRPORTS
 
@@ -46,6 +46,10 @@ def complete_chart_type(
     ctx: Context, param: Parameter, incomplete: str
 ) -> list[CompletionItem]:
     """Complete chart types for list command."""
+    # Deferred: commands pulls in every lookup module, which plain CLI
+    # startup (and completion of other arguments) doesn't need
+    from .commands import CHART_TYPE_ALIASES, VALID_CHART_TYPES
+
     incomplete_upper = incomplete.upper()
     results = []
 
@@ -139,3 +143,172 @@ def complete_facility(
         for facility in FACILITY_CODES
         if facility.upper().startswith(incomplete_upper)
     ]
+
+
+# Completers whose candidates never change. gen-completion writes their
+# candidates straight into the generated script, so the shell only calls
+# back into Python for the data-driven ones (chart names, navaids).
+STATIC_COMPLETERS = (
+    complete_airport,
+    complete_atis_airport,
+    complete_chart_type,
+    complete_sop_query,
+    complete_facility,
+)
+
+# How long the generated script reuses a dynamic completion for the same line
+DYNAMIC_COMPLETION_REUSE_SECONDS = 5
+
+_BASH_COMPLETION_TEMPLATE = """\
+# bash completion for %(prog)s, generated by '%(prog)s gen-completion bash'.
+# Regenerate after upgrading %(prog)s.
+
+%(func)s_key=""
+%(func)s_response=""
+%(func)s_time=0
+
+%(func)s_dynamic() {
+    local IFS=$'\\n'
+    local key="$PWD"$'\\n'"${COMP_WORDS[*]:0:COMP_CWORD+1}"
+    local response completion type value
+    # Bash asks again for the same line (e.g. on the second <TAB> that lists
+    # the matches); reuse a fresh answer rather than starting Python again
+    if [[ $key == "$%(func)s_key" ]] &&
+        ((SECONDS - %(func)s_time < %(reuse_seconds)d)); then
+        response=$%(func)s_response
+    else
+        response=$(env COMP_WORDS="${COMP_WORDS[*]}" COMP_CWORD=$COMP_CWORD \\
+            %(complete_var)s=bash_complete "$1")
+        %(func)s_key=$key
+        %(func)s_response=$response
+        %(func)s_time=$SECONDS
+    fi
+    for completion in $response; do
+        IFS=',' read -r type value <<< "$completion"
+        [[ $type == plain ]] && COMPREPLY+=("$value")
+    done
+}
+
+# Succeeds if option $2 of command $1 takes a value (the next word)
+%(func)s_takes_value() {
+    case "$1:$2" in
+%(value_options)s
+    esac
+    return 1
+}
+
+%(func)s() {
+    local cur="${COMP_WORDS[COMP_CWORD]}"
+    local words="" word i pos=1 restore_case=:
+    COMPREPLY=()
+
+    # Options, and the values of options that take one, are Click's to answer
+    if [[ $cur == -* ]] || { ((COMP_CWORD > 2)) &&
+        %(func)s_takes_value "${COMP_WORDS[1]}" "${COMP_WORDS[COMP_CWORD-1]}"; }; then
+        %(func)s_dynamic "$1"
+        return 0
+    fi
+
+    if ((COMP_CWORD == 1)); then
+        words="%(commands)s"
+    else
+        # Position of the word being completed among the positional
+        # arguments; an option's value is not a positional
+        for ((i = 2; i < COMP_CWORD; i++)); do
+            if [[ ${COMP_WORDS[i]} == -* ]]; then
+                %(func)s_takes_value "${COMP_WORDS[1]}" "${COMP_WORDS[i]}" && ((i++))
+            else
+                ((pos++))
+            fi
+        done
+        case "${COMP_WORDS[1]}:$pos" in
+%(cases)s
+        esac
+    fi
+
+    # Case-insensitive prefix match; nocasematch (unlike ${var^^}) also
+    # works in bash 3.2, the /bin/bash on macOS
+    if ! shopt -q nocasematch; then
+        shopt -s nocasematch
+        restore_case="shopt -u nocasematch"
+    fi
+    for word in $words; do
+        [[ $word == "$cur"* ]] && COMPREPLY+=("$word")
+    done
+    $restore_case
+    return 0
+}
+
+complete -F %(func)s %(prog)s
+"""
+
+
+def generate_bash_completion(group: click.Group, prog_name: str) -> str:
+    """Generate a bash completion script with static candidates inlined.
+
+    Click's own completion starts Python on every <TAB>. This script answers
+    command names and every STATIC_COMPLETERS argument from word lists baked
+    in at generation time, and falls back to Click's completion only for
+    options, option values and dynamic completers. Words that are values of
+    options (the 5 in "route --top 5 SFO") are not counted as positional
+    arguments. Click's answers are kept in shell variables for
+    DYNAMIC_COMPLETION_REUSE_SECONDS, keyed by the working directory and
+    the words up to the cursor. The script runs on bash 3.2 (macOS).
+
+    Args:
+        group: The CLI group whose commands are completed
+        prog_name: Name the script completes (the installed executable)
+
+    Returns:
+        The bash script source.
+    """
+    ctx = click.Context(group, info_name=prog_name)
+    safe_name = prog_name.replace("-", "_")
+    func = f"_{safe_name}_completion"
+    commands = sorted(
+        name for name, command in group.commands.items() if not command.hidden
+    )
+
+    cases = []
+    value_options: list[str] = []
+    for name in commands:
+        arms = []
+        position = 0
+        for param in group.commands[name].params:
+            if not isinstance(param, click.Argument):
+                continue
+            position += 1
+            pattern = f"{name}:*" if param.nargs == -1 else f"{name}:{position}"
+            completer = getattr(param, "_custom_shell_complete", None)
+            if completer is None:
+                arms.append(f"            {pattern}) ;;")
+            elif completer in STATIC_COMPLETERS:
+                values = sorted({item.value for item in completer(ctx, param, "")})
+                arms.append(f'            {pattern}) words="{" ".join(values)}" ;;')
+            else:
+                arms.append(
+                    f'            {pattern}) {func}_dynamic "$1"; return 0 ;;'
+                )
+        # Commands with no completing arguments need no arms at all
+        if any(not arm.endswith(") ;;") for arm in arms):
+            cases.extend(arms)
+        value_options.extend(
+            f"{name}:{opt}"
+            for param in group.commands[name].params
+            if isinstance(param, click.Option)
+            and not param.is_flag
+            and not param.count
+            for opt in param.opts
+        )
+
+    return _BASH_COMPLETION_TEMPLATE % {
+        "prog": prog_name,
+        "func": func,
+        "complete_var": f"_{safe_name.upper()}_COMPLETE",
+        "reuse_seconds": DYNAMIC_COMPLETION_REUSE_SECONDS,
+        "commands": " ".join(commands),
+        "cases": "\n".join(cases),
+        "value_options": f"        {'|'.join(value_options)}) return 0 ;;"
+        if value_options
+        else "",
+    }
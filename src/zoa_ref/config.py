@@ -1,6 +1,5 @@
 """Centralized configuration for ZOA Reference CLI."""
 
-import tempfile
 from pathlib import Path
 
 # =============================================================================
@@ -9,23 +8,30 @@ from pathlib import Path
 CACHE_DIR = Path.home() / ".zoa-ref" / "cache"
 CACHE_TTL_SECONDS = 7 * 24 * 60 * 60  # 7 days
 
-# =============================================================================
-# Temp Directory
-# =============================================================================
-TEMP_DIR = Path(tempfile.gettempdir()) / "zoa-ref-cli"
+# Per-session memo of chart lookups in interactive mode (entries, seconds)
+CHART_LOOKUP_CACHE_SIZE = 128
+CHART_LOOKUP_TTL_SECONDS = 10 * 60
 
+# How long a charts API response for an airport is reused in-process
+CHARTS_API_TTL_SECONDS = 5 * 60
 
-def get_temp_dir() -> Path:
-    """Get the temp directory for ZOA Reference CLI, creating it if needed."""
-    TEMP_DIR.mkdir(parents=True, exist_ok=True)
-    return TEMP_DIR
+# How long scraped routes and ATIS are reused in-process (they're not
+# cached on disk, and ATIS changes at least hourly)
+ROUTES_MEMO_TTL_SECONDS = 60
+ATIS_MEMO_TTL_SECONDS = 30
 
+# How long an airline/airport/aircraft code search is reused in-process
+CODES_MEMO_TTL_SECONDS = 60 * 60
 
 # =============================================================================
 # Browser Settings
 # =============================================================================
 BROWSER_PREF_FILE = Path.home() / ".zoa-ref" / "browser_pref.txt"
 
+# How long a detected running browser is reused, so a burst of chart opens
+# reads the process table once
+RUNNING_BROWSER_TTL_SECONDS = 2
+
 # Playwright's Chromium install location. Set as PLAYWRIGHT_BROWSERS_PATH so
 # the frozen binary's download lives alongside the user's other zoa-ref state
 # rather than being scattered under %LOCALAPPDATA% / ~/.cache.
@@ -126,13 +126,10 @@ def is_fix_identifier(s: str) -> bool:
     Returns:
         True if this looks like a fix/airport/navaid identifier (alphabetic)
     """
-    s = s.upper().strip()
-    if not s:
-        return False
-
-    # Must be all alphabetic to be treated as a fix identifier
+    # Must be all alphabetic to be treated as a fix identifier (isalpha is
+    # False for an empty string and ignores case, so no upper() is needed).
     # Length and validity are checked during the actual lookup
-    return s.isalpha()
+    return s.strip().isalpha()
 
 
 def calculate_fix_descent(from_ident: str, to_ident: str) -> FixDescentResult:
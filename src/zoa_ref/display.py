@@ -1,5 +1,8 @@
 """Display and formatting functions for CLI output."""
 
+from collections.abc import Iterable
+from itertools import chain
+
 import click
 
 from .airways import AirwaySearchResult, FixAirwaysResult
@@ -16,25 +19,31 @@ from .routes import RouteSearchResult
 from .metar import MetarInfo
 from .scratchpads import ScratchpadResult, ScratchpadFacility
 
+# Horizontal rules framing the 80-column tables
+_RULE = "=" * 80
+_THIN_RULE = "-" * 80
 
-def print_table_header(title: str, header: str) -> None:
-    """Print standard table header with title and column headers."""
-    click.echo()
-    click.echo("=" * 80)
-    click.echo(title)
-    click.echo("=" * 80)
-    click.echo(header)
-    click.echo("-" * 80)
+
+def print_table(title: str, header: str, rows: Iterable[str]) -> None:
+    """Print a standard table: title, column headers, then rows.
+
+    Rows may be a generator; they are joined straight onto the header and
+    written with a single echo, without collecting them into a list first.
+    """
+    preamble = ("", _RULE, title, _RULE, header, _THIN_RULE)
+    click.echo("\n".join(chain(preamble, rows)))
 
 
 def print_table_empty(title: str, message: str) -> None:
     """Print empty table with title and message."""
-    click.echo()
-    click.echo("=" * 80)
-    click.echo(title)
-    click.echo("=" * 80)
-    click.echo(f"  {message}")
-    click.echo()
+    click.echo("\n".join(("", _RULE, title, _RULE, f"  {message}", "")))
+
+
+def _fit(text: str, width: int) -> str:
+    """Pad text to width, truncating with a trailing '..' if it is too long."""
+    if len(text) > width:
+        return text[: width - 2] + ".."
+    return text.ljust(width)
 
 
 def display_routes(
@@ -76,17 +85,19 @@ def display_tec_aar_adr_table(routes: list) -> None:
     if not routes:
         return
 
-    click.echo("=" * 80)
-    click.echo("TEC/AAR/ADR ROUTES")
-    click.echo("=" * 80)
-
-    # Header
-    click.echo(f"{'Dep Rwy':<10} {'Arr Rwy':<10} {'Types':<10} Route")
-    click.echo("-" * 80)
-
-    for r in routes:
-        click.echo(f"{r.dep_runway:<10} {r.arr_runway:<10} {r.types:<10} {r.route}")
-    click.echo()
+    lines = [
+        _RULE,
+        "TEC/AAR/ADR ROUTES",
+        _RULE,
+        f"{'Dep Rwy':<10} {'Arr Rwy':<10} {'Types':<10} Route",
+        _THIN_RULE,
+    ]
+    lines.extend(
+        f"{r.dep_runway:<10} {r.arr_runway:<10} {r.types:<10} {r.route}"
+        for r in routes
+    )
+    lines.append("")
+    click.echo("\n".join(lines))
 
 
 def display_loa_rules_table(rules: list) -> None:
@@ -94,19 +105,16 @@ def display_loa_rules_table(rules: list) -> None:
     if not rules:
         return
 
-    click.echo("=" * 80)
-    click.echo("LOA RULES")
-    click.echo("=" * 80)
-
-    # Header
-    click.echo(f"{'Route':<35} {'RNAV?':<8} Notes")
-    click.echo("-" * 80)
-
-    for r in rules:
-        # Truncate route if too long
-        route_display = r.route[:33] + ".." if len(r.route) > 35 else r.route
-        click.echo(f"{route_display:<35} {r.rnav:<8} {r.notes}")
-    click.echo()
+    lines = [
+        _RULE,
+        "LOA RULES",
+        _RULE,
+        f"{'Route':<35} {'RNAV?':<8} Notes",
+        _THIN_RULE,
+    ]
+    lines.extend(f"{_fit(r.route, 35)} {r.rnav:<8} {r.notes}" for r in rules)
+    lines.append("")
+    click.echo("\n".join(lines))
 
 
 def display_real_world_table(routes: list, max_routes: int | None = None) -> None:
@@ -114,28 +122,28 @@ def display_real_world_table(routes: list, max_routes: int | None = None) -> Non
     if not routes:
         return
 
-    click.echo("=" * 80)
-    click.echo("REAL WORLD ROUTES")
-    click.echo("=" * 80)
-
     # Limit routes if max_routes is set
     display_routes_list = routes if max_routes is None else routes[:max_routes]
     truncated = max_routes is not None and len(routes) > max_routes
 
-    # Header
-    click.echo(f"{'Freq':<10} {'Route':<45} Altitude")
-    click.echo("-" * 80)
-
-    for r in display_routes_list:
-        # Truncate route if too long
-        route_display = r.route[:43] + ".." if len(r.route) > 45 else r.route
-        click.echo(f"{r.frequency:<10} {route_display:<45} {r.altitude}")
+    lines = [
+        _RULE,
+        "REAL WORLD ROUTES",
+        _RULE,
+        f"{'Freq':<10} {'Route':<45} Altitude",
+        _THIN_RULE,
+    ]
+    lines.extend(
+        f"{r.frequency:<10} {_fit(r.route, 45)} {r.altitude}"
+        for r in display_routes_list
+    )
 
     if truncated:
-        click.echo(
+        lines.append(
             f"\nShowing top {max_routes} of {len(routes)} routes (use -a for all)"
         )
-    click.echo()
+    lines.append("")
+    click.echo("\n".join(lines))
 
 
 def display_recent_flights_table(flights: list) -> None:
@@ -143,21 +151,19 @@ def display_recent_flights_table(flights: list) -> None:
     if not flights:
         return
 
-    click.echo("=" * 80)
-    click.echo("RECENT FLIGHTS")
-    click.echo("=" * 80)
-
-    # Header
-    click.echo(f"{'Callsign':<12} {'Type':<8} {'Route':<40} Altitude")
-    click.echo("-" * 80)
-
-    for f in flights:
-        # Truncate route if too long
-        route_display = f.route[:38] + ".." if len(f.route) > 40 else f.route
-        click.echo(
-            f"{f.callsign:<12} {f.aircraft_type:<8} {route_display:<40} {f.altitude}"
-        )
-    click.echo()
+    lines = [
+        _RULE,
+        "RECENT FLIGHTS",
+        _RULE,
+        f"{'Callsign':<12} {'Type':<8} {'Route':<40} Altitude",
+        _THIN_RULE,
+    ]
+    lines.extend(
+        f"{f.callsign:<12} {f.aircraft_type:<8} {_fit(f.route, 40)} {f.altitude}"
+        for f in flights
+    )
+    lines.append("")
+    click.echo("\n".join(lines))
 
 
 def display_airlines(result: AirlineSearchResult) -> None:
@@ -166,19 +172,15 @@ def display_airlines(result: AirlineSearchResult) -> None:
         print_table_empty("AIRLINE CODES", f"No airlines found for '{result.query}'.")
         return
 
-    print_table_header(
+    print_table(
         "AIRLINE CODES",
         f"{'ICAO':<8} {'Telephony':<15} {'Name':<35} Country",
+        (
+            f"{a.icao_id:<8} {a.telephony:<15} {_fit(a.name, 35)} {a.country}"
+            for a in result.results
+        ),
     )
 
-    for airline in result.results:
-        name_display = (
-            airline.name[:33] + ".." if len(airline.name) > 35 else airline.name
-        )
-        click.echo(
-            f"{airline.icao_id:<8} {airline.telephony:<15} {name_display:<35} {airline.country}"
-        )
-
 
 def display_airport_codes(result: AirportSearchResult) -> None:
     """Display airport code search results in formatted CLI output."""
@@ -186,13 +188,17 @@ def display_airport_codes(result: AirportSearchResult) -> None:
         print_table_empty("AIRPORT CODES", f"No airports found for '{result.query}'.")
         return
 
-    print_table_header(
+    print_table(
         "AIRPORT CODES",
         f"{'ICAO':<8} {'Local':<8} Name",
+        (f"{a.icao_id:<8} {a.local_id:<8} {a.name}" for a in result.results),
     )
 
-    for airport in result.results:
-        click.echo(f"{airport.icao_id:<8} {airport.local_id:<8} {airport.name}")
+
+_AIRCRAFT_ROW_FMT = (
+    "{type_designator:<8} {mfr_model} {engine:<5} "
+    "{faa_weight:<4} {cwt:<5} {srs:<5} {lahso}"
+)
 
 
 def display_aircraft(result: AircraftSearchResult) -> None:
@@ -201,29 +207,24 @@ def display_aircraft(result: AircraftSearchResult) -> None:
         print_table_empty("AIRCRAFT TYPES", f"No aircraft found for '{result.query}'.")
         return
 
-    print_table_header(
+    print_table(
         "AIRCRAFT TYPES",
         f"{'Type':<8} {'Manufacturer/Model':<30} {'Eng':<5} {'Wt':<4} {'CWT':<5} {'SRS':<5} LAHSO",
+        (
+            _AIRCRAFT_ROW_FMT.format(
+                mfr_model=_fit(f"{ac.manufacturer} {ac.model}", 30), **vars(ac)
+            )
+            for ac in result.results
+        ),
     )
 
-    for ac in result.results:
-        mfr_model = f"{ac.manufacturer} {ac.model}"
-        mfr_display = mfr_model[:28] + ".." if len(mfr_model) > 30 else mfr_model
-        click.echo(
-            f"{ac.type_designator:<8} {mfr_display:<30} {ac.engine:<5} "
-            f"{ac.faa_weight:<4} {ac.cwt:<5} {ac.srs:<5} {ac.lahso}"
-        )
-
 
 def display_atis(atis_list: list[AtisInfo]) -> None:
     """Display ATIS information in formatted CLI output."""
-    for atis in atis_list:
-        click.echo()
-        click.echo("=" * 80)
-        click.echo(f"ATIS - {atis.airport}")
-        click.echo("=" * 80)
-        click.echo(atis.raw_text)
-    click.echo()
+    blocks = [
+        f"\n{_RULE}\nATIS - {a.airport}\n{_RULE}\n{a.raw_text}\n" for a in atis_list
+    ]
+    click.echo("".join(blocks))
 
 
 _FLIGHT_CAT_COLORS = {
@@ -255,21 +256,15 @@ def _format_altimeter(altim: float | None) -> str:
 def display_metar(metars: list[MetarInfo]) -> None:
     """Display METAR information with flight category and highlights."""
     for metar in metars:
-        click.echo()
-        click.echo("=" * 80)
-
         # Station header with flight category color
         cat = metar.flight_category or "UNK"
         cat_color = _FLIGHT_CAT_COLORS.get(cat, "white")
         header = f"METAR - {metar.station}"
         if metar.name:
             header += f" ({metar.name})"
-        click.echo(header)
-        click.echo("=" * 80)
 
-        # Raw METAR
-        click.echo(metar.raw)
-        click.echo()
+        # Header and raw METAR
+        click.echo(f"\n{_RULE}\n{header}\n{_RULE}\n{metar.raw}\n")
 
         # Flight category
         click.echo("  Flight Category: ", nl=False)
@@ -328,24 +323,26 @@ def display_metar(metars: list[MetarInfo]) -> None:
 
 def display_chart_matches(matches: list[ChartMatch]) -> None:
     """Display numbered list of matching charts."""
-    click.echo("\nMultiple charts found:")
-    click.echo("-" * 60)
+    lines = ["\nMultiple charts found:", "-" * 60]
     for i, match in enumerate(matches, start=1):
         chart = match.chart
         type_str = chart.chart_code if chart.chart_code else "?"
-        click.echo(
+        lines.append(
             f"  [{i}] [{type_str:<4}] {chart.chart_name} (score: {match.score:.2f})"
         )
-    click.echo()
+    lines.append("")
+    click.echo("\n".join(lines))
 
 
 def display_procedure_matches(matches: list[ProcedureMatch]) -> None:
     """Display numbered list of matching procedures."""
-    click.echo("\nMultiple procedures found:")
-    click.echo("-" * 60)
-    for i, match in enumerate(matches, start=1):
-        click.echo(f"  [{i}] {match.procedure.name} (score: {match.score:.2f})")
-    click.echo()
+    lines = ["\nMultiple procedures found:", "-" * 60]
+    lines.extend(
+        f"  [{i}] {match.procedure.name} (score: {match.score:.2f})"
+        for i, match in enumerate(matches, start=1)
+    )
+    lines.append("")
+    click.echo("\n".join(lines))
 
 
 def display_positions(result: PositionSearchResult) -> None:
@@ -354,23 +351,16 @@ def display_positions(result: PositionSearchResult) -> None:
         print_table_empty("POSITIONS", f"No positions found for '{result.query}'.")
         return
 
-    print_table_header(
+    print_table(
         "POSITIONS",
         f"{'Name':<25} {'TCP':<6} {'Callsign':<15} {'Radio Name':<18} Freq",
+        (
+            f"{_fit(pos.name, 25)} {pos.tcp:<6} {_fit(pos.callsign, 15)} "
+            f"{_fit(pos.radio_name, 18)} {pos.frequency}"
+            for pos in result.results
+        ),
     )
 
-    for pos in result.results:
-        name_display = pos.name[:23] + ".." if len(pos.name) > 25 else pos.name
-        callsign_display = (
-            pos.callsign[:13] + ".." if len(pos.callsign) > 15 else pos.callsign
-        )
-        radio_display = (
-            pos.radio_name[:16] + ".." if len(pos.radio_name) > 18 else pos.radio_name
-        )
-        click.echo(
-            f"{name_display:<25} {pos.tcp:<6} {callsign_display:<15} {radio_display:<18} {pos.frequency}"
-        )
-
 
 def display_scratchpads(result: ScratchpadResult) -> None:
     """Display scratchpad results in formatted CLI output."""
@@ -380,14 +370,12 @@ def display_scratchpads(result: ScratchpadResult) -> None:
         )
         return
 
-    print_table_header(
+    print_table(
         f"SCRATCHPADS - {result.facility}",
         f"{'Code':<12} Meaning",
+        (f"{sp.code:<12} {sp.meaning}" for sp in result.scratchpads),
     )
 
-    for sp in result.scratchpads:
-        click.echo(f"{sp.code:<12} {sp.meaning}")
-
 
 def display_scratchpad_facilities(facilities: list[ScratchpadFacility]) -> None:
     """Display available scratchpad facilities."""
@@ -465,9 +453,7 @@ def display_airway(result: AirwaySearchResult) -> None:
 
     # Header with direction
     direction_str = f" ({airway.direction})" if airway.direction else ""
-    click.echo()
-    click.echo(f"AIRWAY {airway.identifier}{direction_str} - {len(airway.fixes)} fixes")
-    click.echo()
+    header = f"AIRWAY {airway.identifier}{direction_str} - {len(airway.fixes)} fixes"
 
     # Build fix strings
     fix_parts = []
@@ -508,9 +494,7 @@ def display_airway(result: AirwaySearchResult) -> None:
     if current_line:
         lines.append(current_line)
 
-    for line in lines:
-        click.echo(line)
-    click.echo()
+    click.echo("\n".join(["", header, "", *lines, ""]))
 
 
 def display_fix_airways(result: FixAirwaysResult) -> None:
@@ -522,9 +506,7 @@ def display_fix_airways(result: FixAirwaysResult) -> None:
         return
 
     fix = result.query.upper()
-    click.echo()
-    click.echo(f"FIX {fix} - found on {len(result.airways)} airway(s)")
-    click.echo()
+    lines = ["", f"FIX {fix} - found on {len(result.airways)} airway(s)", ""]
 
     for airway in result.airways:
         direction_str = f" ({airway.direction})" if airway.direction else ""
@@ -557,12 +539,13 @@ def display_fix_airways(result: FixAirwaysResult) -> None:
         suffix = ".." if end < len(names) else ""
         snippet = prefix + "..".join(snippet_parts) + suffix
 
-        click.echo(
+        lines.append(
             f"  {airway.identifier:<6}{direction_str:<14} "
             f"{len(airway.fixes):>2} fixes   {snippet}"
         )
 
-    click.echo()
+    lines.append("")
+    click.echo("\n".join(lines))
 
 
 def display_mea(result: MeaResult) -> None:
@@ -2,14 +2,18 @@
 
 import json
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from playwright.sync_api import Page, TimeoutError as PlaywrightTimeout
 
-from zoa_ref.config import CACHE_DIR, CACHE_TTL_SECONDS
+from zoa_ref.config import CACHE_DIR, CACHE_TTL_SECONDS, CODES_MEMO_TTL_SECONDS
 
 CODES_URL = "https://reference.oakartcc.org/codes"
 
+# Search results CodesPage keeps in memory for the life of the session
+CODES_MEMO_SIZE = 256
+
 
 @dataclass
 class AirlineCode:
@@ -288,7 +292,7 @@ def _search_aircraft_multi_term(page: Page, query: str) -> list[AircraftCode]:
         return results
 
     # If no results and query has multiple words, try word-by-word search
-    terms = query.strip().split()
+    terms = query.split()
     if len(terms) <= 1:
         return []
 
@@ -317,7 +321,8 @@ class CodesPage:
 
     Usage:
         codes_page = CodesPage(browser_session)
-        codes_page.ensure_ready()  # Navigate once
+        codes_page.start_loading()  # Optional: begin navigating, don't wait
+        codes_page.ensure_ready()  # Navigate once (or finish start_loading)
         result = codes_page.search_airline("UAL")  # Fast - no navigation
         result = codes_page.search_aircraft("B738")  # Fast - reuses page
     """
@@ -327,9 +332,36 @@ class CodesPage:
         self._session = session
         self._page = None
         self._ready = False
+        self._loading = False
+        # (kind, lowercased query) -> (monotonic time, result), LRU ordered
+        self._memo: OrderedDict = OrderedDict()
+
+    def start_loading(self, timeout: int = 30000) -> None:
+        """Begin navigating to the codes URL without waiting for the page to load.
+
+        The browser keeps loading in its own process while the caller carries
+        on (e.g. showing the interactive prompt); ensure_ready() then only
+        waits for whatever is left. Playwright's sync API is bound to the
+        thread that created it, so this stands in for a background warm-up.
+        """
+        if self._ready or self._loading:
+            return
+
+        try:
+            if not self._page:
+                self._page = self._session.new_page()
+            self._page.goto(CODES_URL, wait_until="commit", timeout=timeout)
+            self._loading = True
+        except Exception:
+            self._loading = False
 
     def ensure_ready(self, timeout: int = 30000) -> bool:
         """Ensure page is created and navigated to codes URL."""
+        if self._page is not None and self._page.is_closed():
+            # The renderer crashed or the page was closed; start over
+            self._page = None
+            self._ready = False
+            self._loading = False
         if self._ready and self._page:
             return True
 
@@ -337,6 +369,19 @@ class CodesPage:
             if not self._page:
                 self._page = self._session.new_page()
 
+            if self._loading:
+                # Navigation was started by start_loading(); finish it
+                self._loading = False
+                try:
+                    self._page.wait_for_load_state("networkidle", timeout=timeout)
+                    self._page.wait_for_selector(
+                        'input[placeholder="Airline 3-letter"]', timeout=10000
+                    )
+                    self._ready = True
+                    return True
+                except Exception:
+                    pass  # Fall back to a full navigation below
+
             self._page.goto(CODES_URL, wait_until="networkidle", timeout=timeout)
             self._page.wait_for_selector(
                 'input[placeholder="Airline 3-letter"]', timeout=10000
@@ -347,16 +392,41 @@ class CodesPage:
             self._ready = False
             return False
 
+    def _memoized(self, kind: str, query: str):
+        """Return an in-memory result from a recent search this session."""
+        key = (kind, query.lower())
+        entry = self._memo.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > CODES_MEMO_TTL_SECONDS:
+            del self._memo[key]
+            return None
+        self._memo.move_to_end(key)
+        return entry[1]
+
+    def _remember(self, kind: str, query: str, result) -> None:
+        """Keep a search result in memory, evicting the least recently used."""
+        key = (kind, query.lower())
+        self._memo[key] = (time.monotonic(), result)
+        self._memo.move_to_end(key)
+        while len(self._memo) > CODES_MEMO_SIZE:
+            self._memo.popitem(last=False)
+
     def search_airline(
         self, query: str, use_cache: bool = True
     ) -> AirlineSearchResult | None:
         """Search airlines on the persistent page."""
-        # Check cache first
+        # Check in-memory and file caches first
         if use_cache:
+            memo = self._memoized("airline", query)
+            if memo is not None:
+                return memo
             cached = _load_from_cache("airline", query)
             if cached:
                 results = [AirlineCode(**r) for r in cached["results"]]
-                return AirlineSearchResult(query=query, results=results)
+                result = AirlineSearchResult(query=query, results=results)
+                self._remember("airline", query, result)
+                return result
 
         if not self._ready or self._page is None:
             return None
@@ -366,18 +436,26 @@ class CodesPage:
         if use_cache and results:
             _save_to_cache("airline", query, [asdict(r) for r in results])
 
-        return AirlineSearchResult(query=query, results=results)
+        result = AirlineSearchResult(query=query, results=results)
+        if results:
+            self._remember("airline", query, result)
+        return result
 
     def search_airport(
         self, query: str, use_cache: bool = True
     ) -> AirportSearchResult | None:
         """Search airports on the persistent page."""
-        # Check cache first
+        # Check in-memory and file caches first
         if use_cache:
+            memo = self._memoized("airport", query)
+            if memo is not None:
+                return memo
             cached = _load_from_cache("airport", query)
             if cached:
                 results = [AirportCode(**r) for r in cached["results"]]
-                return AirportSearchResult(query=query, results=results)
+                result = AirportSearchResult(query=query, results=results)
+                self._remember("airport", query, result)
+                return result
 
         if not self._ready or self._page is None:
             return None
@@ -387,18 +465,26 @@ class CodesPage:
         if use_cache and results:
             _save_to_cache("airport", query, [asdict(r) for r in results])
 
-        return AirportSearchResult(query=query, results=results)
+        result = AirportSearchResult(query=query, results=results)
+        if results:
+            self._remember("airport", query, result)
+        return result
 
     def search_aircraft(
         self, query: str, use_cache: bool = True
     ) -> AircraftSearchResult | None:
         """Search aircraft on the persistent page."""
-        # Check cache first
+        # Check in-memory and file caches first
         if use_cache:
+            memo = self._memoized("aircraft", query)
+            if memo is not None:
+                return memo
             cached = _load_from_cache("aircraft", query)
             if cached:
                 results = [AircraftCode(**r) for r in cached["results"]]
-                return AircraftSearchResult(query=query, results=results)
+                result = AircraftSearchResult(query=query, results=results)
+                self._remember("aircraft", query, result)
+                return result
 
         if not self._ready or self._page is None:
             return None
@@ -408,7 +494,10 @@ class CodesPage:
         if use_cache and results:
             _save_to_cache("aircraft", query, [asdict(r) for r in results])
 
-        return AircraftSearchResult(query=query, results=results)
+        result = AircraftSearchResult(query=query, results=results)
+        if results:
+            self._remember("aircraft", query, result)
+        return result
 
     def close(self):
         """Close the page."""
@@ -419,6 +508,7 @@ class CodesPage:
                 pass
             self._page = None
             self._ready = False
+            self._loading = False
 
 
 # --- Public search functions ---
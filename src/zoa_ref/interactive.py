@@ -1,6 +1,7 @@
 """Interactive mode handlers and main loop."""
 
-import webbrowser
+import os
+import sys
 
 import click
 
@@ -9,6 +10,7 @@ from .browser import BrowserSession
 from .cli_utils import (
     InteractiveContext,
     parse_interactive_args,
+    format_interactive_help,
     print_interactive_help,
     print_command_help,
 )
@@ -263,6 +265,7 @@ def _handle_chart_interactive(query: str, ctx: InteractiveContext) -> None:
         link_only=link_only,
         rotation=rotation,
         visible_session=visible_session,
+        lookup_cache=ctx.chart_lookup_cache,
     )
 
 
@@ -310,12 +313,16 @@ def _handle_vr_interactive(args: str) -> None:
 
 def _handle_vis_interactive(args: str) -> None:
     """Handle 'vis' command in interactive mode."""
+    import webbrowser
+
     webbrowser.open(AIRSPACE_URL)
     click.echo("Opened airspace visualizer")
 
 
 def _handle_tdls_interactive(args: str) -> None:
     """Handle 'tdls' command in interactive mode."""
+    import webbrowser
+
     facility = args.strip()
     if facility:
         url = f"{TDLS_URL}{facility.upper()}"
@@ -328,6 +335,8 @@ def _handle_tdls_interactive(args: str) -> None:
 
 def _handle_strips_interactive(args: str) -> None:
     """Handle 'strips' command in interactive mode."""
+    import webbrowser
+
     facility = args.strip()
     if facility:
         url = f"{STRIPS_URL}{facility.upper()}"
@@ -478,6 +487,10 @@ def _handle_setbrowser_interactive(args: str) -> None:
     do_setbrowser(browser)
 
 
+# Arguments to 'sethotkey' that remove the saved hotkey
+_HOTKEY_CLEAR_WORDS = frozenset(("clear", "none", "off"))
+
+
 def _handle_sethotkey_interactive(
     args: str, ctx: InteractiveContext | None = None
 ) -> None:
@@ -489,7 +502,7 @@ def _handle_sethotkey_interactive(
         print_command_help("sethotkey", main)
         return
 
-    if parsed.positional and parsed.positional[0].lower() in ("clear", "none", "off"):
+    if parsed.positional and parsed.positional[0].casefold() in _HOTKEY_CLEAR_WORDS:
         do_clear_hotkey(ctx)
         return
 
@@ -527,45 +540,57 @@ def _handle_uses_interactive(args: str) -> None:
     )
 
 
-# Command registry: maps command prefix to (handler, prefix_length, needs_context)
+# Command registry: maps command name to (handler, needs_context).
+# Dispatch is a single dict lookup on the first word of the input;
 # needs_context indicates whether the handler requires InteractiveContext
 INTERACTIVE_COMMANDS: dict[str, tuple] = {
-    "list ": (_handle_list_interactive, 5, False),
-    "charts ": (_handle_charts_interactive, 7, True),
-    "route ": (_handle_route_interactive, 6, True),
-    "metar ": (_handle_metar_interactive, 6, False),
-    "atis": (_handle_atis_interactive, 4, True),
-    "sop ": (_handle_sop_interactive, 4, True),
-    "proc ": (_handle_sop_interactive, 5, True),
-    "airline ": (_handle_airline_interactive, 8, True),
-    "al ": (_handle_airline_interactive, 3, True),
-    "airport ": (_handle_airport_interactive, 8, True),
-    "ap ": (_handle_airport_interactive, 3, True),
-    "aircraft ": (_handle_aircraft_interactive, 9, True),
-    "ac ": (_handle_aircraft_interactive, 3, True),
-    "navaid ": (_handle_navaid_interactive, 7, False),
-    "airway ": (_handle_airway_interactive, 7, False),
-    "aw ": (_handle_airway_interactive, 3, False),
-    "descent ": (_handle_descent_interactive, 8, False),
-    "des ": (_handle_descent_interactive, 4, False),
-    "approaches ": (_handle_approaches_interactive, 11, False),
-    "apps ": (_handle_approaches_interactive, 5, False),
-    "mea ": (_handle_mea_interactive, 4, False),
-    "cifp ": (_handle_cifp_interactive, 5, False),
-    "uses ": (_handle_uses_interactive, 5, False),
-    "position ": (_handle_position_interactive, 9, True),
-    "pos ": (_handle_position_interactive, 4, True),
-    "scratchpad ": (_handle_scratchpad_interactive, 11, True),
-    "scratch ": (_handle_scratchpad_interactive, 8, True),
-    "vr": (_handle_vr_interactive, 2, False),
-    "vis": (_handle_vis_interactive, 3, False),
-    "tdls": (_handle_tdls_interactive, 4, False),
-    "strips": (_handle_strips_interactive, 6, False),
-    "setbrowser": (_handle_setbrowser_interactive, 10, False),
-    "sethotkey": (_handle_sethotkey_interactive, 9, True),
+    "list": (_handle_list_interactive, False),
+    "charts": (_handle_charts_interactive, True),
+    "route": (_handle_route_interactive, True),
+    "metar": (_handle_metar_interactive, False),
+    "atis": (_handle_atis_interactive, True),
+    "sop": (_handle_sop_interactive, True),
+    "proc": (_handle_sop_interactive, True),
+    "airline": (_handle_airline_interactive, True),
+    "al": (_handle_airline_interactive, True),
+    "airport": (_handle_airport_interactive, True),
+    "ap": (_handle_airport_interactive, True),
+    "aircraft": (_handle_aircraft_interactive, True),
+    "ac": (_handle_aircraft_interactive, True),
+    "navaid": (_handle_navaid_interactive, False),
+    "airway": (_handle_airway_interactive, False),
+    "aw": (_handle_airway_interactive, False),
+    "descent": (_handle_descent_interactive, False),
+    "des": (_handle_descent_interactive, False),
+    "approaches": (_handle_approaches_interactive, False),
+    "apps": (_handle_approaches_interactive, False),
+    "mea": (_handle_mea_interactive, False),
+    "cifp": (_handle_cifp_interactive, False),
+    "uses": (_handle_uses_interactive, False),
+    "position": (_handle_position_interactive, True),
+    "pos": (_handle_position_interactive, True),
+    "scratchpad": (_handle_scratchpad_interactive, True),
+    "scratch": (_handle_scratchpad_interactive, True),
+    "vr": (_handle_vr_interactive, False),
+    "vis": (_handle_vis_interactive, False),
+    "tdls": (_handle_tdls_interactive, False),
+    "strips": (_handle_strips_interactive, False),
+    "setbrowser": (_handle_setbrowser_interactive, False),
+    "sethotkey": (_handle_sethotkey_interactive, True),
 }
 
 
+# Startup banner framing around the command help
+_BANNER_TITLE = "ZOA Reference CLI - Interactive Mode"
+_BANNER_RULE = "=" * 50
+
+# Inputs that end the interactive session
+_EXIT_COMMANDS = frozenset(("quit", "exit", "q"))
+
+# Second words that turn "AIRPORT <word> ..." into an SOP lookup
+_SOP_WORDS = frozenset(("sop", "proc"))
+
+
 def interactive_mode(use_playwright: bool = False):
     """Run in interactive mode for continuous lookups.
 
@@ -576,39 +601,37 @@ def interactive_mode(use_playwright: bool = False):
     # Import here to avoid circular import at module level
     from .cli import main
 
-    click.echo("ZOA Reference CLI - Interactive Mode")
-    if use_playwright:
-        click.echo("(Using Playwright browser with tab management)")
-    click.echo("=" * 50)
-    print_interactive_help()
-    click.echo("=" * 50)
-    click.echo()
-
-    # Initialize chart list cache and start background prefetch
+    # Start the chart list prefetch (a background thread) before anything
+    # else, so its downloads overlap the banner and the browser launch below.
+    # Playwright's sync API is tied to the thread that starts it, so the
+    # browser itself has to be launched here on the main thread.
     chart_cache = ChartListCache()
     chart_cache.prefetch_airports()  # Uses major airports + user's top 10
 
+    # Write the whole banner at once
+    banner = [_BANNER_TITLE]
+    if use_playwright:
+        banner.append("(Using Playwright browser with tab management)")
+    banner += [_BANNER_RULE, format_interactive_help(), _BANNER_RULE, ""]
+    click.echo("\n".join(banner))
+
     # Initialize browser sessions and context
-    headless_session = BrowserSession(headless=True)
+    headless_session = BrowserSession(headless=True, block_resources=True)
     headless_session.start()
     codes_page = CodesPage(headless_session)
-    codes_page.ensure_ready()  # Pre-navigate so first lookup is fast
+    # Start loading the codes page now, but don't block the prompt on it;
+    # the first airline/airport/aircraft lookup finishes the wait if needed
+    codes_page.start_loading()
 
-    # Create context with optional visible session for playwright mode
+    # Create context; in playwright mode the visible browser is launched on
+    # first use (ctx.get_or_create_visible_session), not at startup
     ctx = InteractiveContext(
         headless_session=headless_session,
         codes_page=codes_page,
         use_playwright=use_playwright,
-        visible_session=(
-            headless_session.create_child_session(headless=False)
-            if use_playwright
-            else None
-        ),
     )
 
     # Restore saved global hotkey if any (Windows only)
-    import sys
-
     if sys.platform == "win32":
         from .hotkey import load_hotkey_preference, format_hotkey, HotkeyManager
 
@@ -645,22 +668,19 @@ def interactive_mode(use_playwright: bool = False):
             if not query:
                 continue
 
-            lower_query = query.lower()
+            # Split off the command word once; every branch below keys on it
+            first, _, rest = query.partition(" ")
+            cmd_name = first.casefold()
+            rest = rest.strip()
 
-            if lower_query in ("quit", "exit", "q"):
+            if cmd_name in _EXIT_COMMANDS and not rest:
                 click.echo("Goodbye!")
                 break
 
-            if lower_query == "help":
-                print_interactive_help()
-                click.echo()
-                continue
-
-            if lower_query.startswith("help "):
-                cmd_name = query[5:].strip()
-                if cmd_name:
-                    if not print_command_help(cmd_name, main):
-                        click.echo(f"Unknown command: {cmd_name}")
+            if cmd_name == "help":
+                if rest:
+                    if not print_command_help(rest, main):
+                        click.echo(f"Unknown command: {rest}")
                         click.echo(
                             "Available commands: chart, charts, list, route, atis, sop, proc, airline (al), airport (ap), aircraft (ac)"
                         )
@@ -670,28 +690,19 @@ def interactive_mode(use_playwright: bool = False):
                 continue
 
             # Check command registry
-            handled = False
-            for prefix, (
-                handler,
-                prefix_len,
-                needs_ctx,
-            ) in INTERACTIVE_COMMANDS.items():
-                if lower_query.startswith(prefix):
-                    args = query[prefix_len:]
-                    if needs_ctx:
-                        handler(args, ctx)
-                    else:
-                        handler(args)
-                    click.echo()
-                    handled = True
-                    break
-
-            if handled:
+            entry = INTERACTIVE_COMMANDS.get(cmd_name)
+            if entry is not None:
+                handler, needs_ctx = entry
+                if needs_ctx:
+                    handler(rest, ctx)
+                else:
+                    handler(rest)
+                click.echo()
                 continue
 
             # Handle explicit "chart" command prefix (alias for implicit chart lookup)
-            if lower_query.startswith("chart "):
-                query = query[6:].strip()
+            if cmd_name == "chart":
+                query = rest
                 if not query:
                     click.echo(
                         "Usage: chart <airport> <chart>  (e.g., chart OAK CNDEL5)"
@@ -699,12 +710,15 @@ def interactive_mode(use_playwright: bool = False):
                     click.echo()
                     continue
                 # Fall through to chart lookup below
+                first, _, rest = query.partition(" ")
+                rest = rest.strip()
 
-            # Check for "AIRPORT sop/proc" pattern before chart fallback
-            parts = query.split(None, 2)  # Split into max 3 parts
-            if len(parts) >= 2 and parts[1].lower() in ("sop", "proc"):
+            # Check for "AIRPORT sop/proc" pattern before chart fallback,
+            # reusing the split above rather than re-tokenizing the line
+            words = rest.split(None, 1)
+            if words and words[0].casefold() in _SOP_WORDS:
                 # Rewrite "OAK sop 2-2" -> "OAK 2-2" as args to sop handler
-                sop_args = parts[0] + (" " + parts[2] if len(parts) > 2 else "")
+                sop_args = first + (" " + words[1] if len(words) > 1 else "")
                 _handle_sop_interactive(sop_args, ctx)
                 click.echo()
                 continue
@@ -718,7 +732,8 @@ def interactive_mode(use_playwright: bool = False):
         if ctx.hotkey_manager is not None:
             ctx.hotkey_manager.cleanup()
 
-        ctx.codes_page.close()
+        # The codes page lives in headless_session, so stopping that session
+        # closes it; no separate page close round trip is needed on exit.
         # Stop child session first (visible browser), then parent (headless)
         # Parent owns the Playwright instance, so it must be stopped last
         if ctx.visible_session is not None:
@@ -727,7 +742,4 @@ def interactive_mode(use_playwright: bool = False):
 
         # Suppress asyncio "Task exception was never retrieved" on Ctrl+C exit
         if ctrl_c_exit:
-            import sys
-            import os
-
             sys.stderr = open(os.devnull, "w")
@@ -0,0 +1,149 @@
+"""Process table snapshots via the ToolHelp API (Windows only).
+
+Provides:
+- snapshot_processes(): PID, parent PID and exe name of every process
+- get_process_creation_time(): Creation time of a single process
+
+Used by browser auto-detection on every chart open, so it reads the process
+table in-process rather than spawning wmic and parsing its CSV output.
+"""
+
+import ctypes
+import ctypes.wintypes as wt
+from dataclasses import dataclass
+
+# =============================================================================
+# Win32 Constants
+# =============================================================================
+
+TH32CS_SNAPPROCESS = 0x00000002
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+MAX_PATH = 260
+
+
+# =============================================================================
+# Win32 Structures
+# =============================================================================
+
+
+class PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", wt.DWORD),
+        ("cntUsage", wt.DWORD),
+        ("th32ProcessID", wt.DWORD),
+        ("th32DefaultHeapID", ctypes.c_size_t),  # ULONG_PTR
+        ("th32ModuleID", wt.DWORD),
+        ("cntThreads", wt.DWORD),
+        ("th32ParentProcessID", wt.DWORD),
+        ("pcPriClassBase", wt.LONG),
+        ("dwFlags", wt.DWORD),
+        ("szExeFile", wt.WCHAR * MAX_PATH),
+    ]
+
+
+@dataclass(slots=True)
+class ProcessEntry:
+    """One row of the process table."""
+
+    pid: int
+    parent_pid: int
+    name: str  # Executable file name, lowercased (e.g. "chrome.exe")
+
+
+# =============================================================================
+# Kernel32 Bindings
+# =============================================================================
+
+_kernel32 = None
+
+
+def _get_kernel32():
+    """Load kernel32 with HANDLE-correct signatures (once per process).
+
+    A private WinDLL instance keeps these argtypes from leaking into the
+    shared ctypes.windll.kernel32 used by the hotkey module.
+    """
+    global _kernel32
+    if _kernel32 is None:
+        k32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        k32.CreateToolhelp32Snapshot.argtypes = [wt.DWORD, wt.DWORD]
+        k32.CreateToolhelp32Snapshot.restype = wt.HANDLE
+        k32.Process32FirstW.argtypes = [wt.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+        k32.Process32FirstW.restype = wt.BOOL
+        k32.Process32NextW.argtypes = [wt.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+        k32.Process32NextW.restype = wt.BOOL
+        k32.OpenProcess.argtypes = [wt.DWORD, wt.BOOL, wt.DWORD]
+        k32.OpenProcess.restype = wt.HANDLE
+        k32.GetProcessTimes.argtypes = [wt.HANDLE] + [ctypes.POINTER(wt.FILETIME)] * 4
+        k32.GetProcessTimes.restype = wt.BOOL
+        k32.CloseHandle.argtypes = [wt.HANDLE]
+        k32.CloseHandle.restype = wt.BOOL
+        _kernel32 = k32
+    return _kernel32
+
+
+# =============================================================================
+# Public API
+# =============================================================================
+
+
+def snapshot_processes() -> list[ProcessEntry]:
+    """List every running process from a single ToolHelp snapshot.
+
+    Returns:
+        One ProcessEntry per process.
+
+    Raises:
+        OSError: If the snapshot could not be taken.
+    """
+    kernel32 = _get_kernel32()
+    snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if snapshot is None or snapshot == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+
+    processes: list[ProcessEntry] = []
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        more = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while more:
+            processes.append(
+                ProcessEntry(
+                    pid=entry.th32ProcessID,
+                    parent_pid=entry.th32ParentProcessID,
+                    name=entry.szExeFile.lower(),
+                )
+            )
+            more = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(snapshot)
+    return processes
+
+
+def get_process_creation_time(pid: int) -> int:
+    """Get a process's creation time as a FILETIME tick count.
+
+    Only comparable with other values from this function. Returns 0 if the
+    process has exited or can't be queried.
+    """
+    kernel32 = _get_kernel32()
+    handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return 0
+    try:
+        creation = wt.FILETIME()
+        exit_time = wt.FILETIME()
+        kernel_time = wt.FILETIME()
+        user_time = wt.FILETIME()
+        if not kernel32.GetProcessTimes(
+            handle,
+            ctypes.byref(creation),
+            ctypes.byref(exit_time),
+            ctypes.byref(kernel_time),
+            ctypes.byref(user_time),
+        ):
+            return 0
+        return (creation.dwHighDateTime << 32) | creation.dwLowDateTime
+    finally:
+        kernel32.CloseHandle(handle)
@@ -0,0 +1,59 @@
+"""In-process reuse of charts-API responses in fetch_charts_from_api."""
+
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from zoa_ref import cache, charts
+
+_PAYLOAD = {
+    "KOAK": [
+        {
+            "chart_name": "AIRPORT DIAGRAM",
+            "chart_code": "APD",
+            "pdf_path": "https://example.test/oak_apd.pdf",
+            "faa_ident": "OAK",
+            "icao_ident": "KOAK",
+        }
+    ]
+}
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    """Serve _PAYLOAD from urlopen and count the requests made."""
+    requests: list[str] = []
+
+    def fake_urlopen(req, timeout=None):
+        requests.append(req.full_url)
+        return io.BytesIO(json.dumps(_PAYLOAD).encode())
+
+    monkeypatch.setattr(charts.urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(cache, "cleanup_old_airac_caches", lambda keep_cycles: None)
+    monkeypatch.setattr(charts, "_charts_api_cache", {})
+    return requests
+
+
+def test_repeat_fetch_reuses_response(fake_api):
+    """A second fetch for the same airport (any case) makes no request."""
+    first = charts.fetch_charts_from_api("OAK")
+    second = charts.fetch_charts_from_api("oak")
+    assert len(fake_api) == 1
+    assert first == second
+
+
+def test_cached_list_is_not_shared(fake_api):
+    """Callers get their own list, so mutating it leaves the cache intact."""
+    charts.fetch_charts_from_api("OAK").clear()
+    assert len(charts.fetch_charts_from_api("OAK")) == 1
+
+
+def test_expired_entry_is_refetched(fake_api, monkeypatch):
+    """Entries older than the TTL trigger a fresh request."""
+    charts.fetch_charts_from_api("OAK")
+    monkeypatch.setattr(charts, "CHARTS_API_TTL_SECONDS", 0)
+    charts.fetch_charts_from_api("OAK")
+    assert len(fake_api) == 2
@@ -0,0 +1,51 @@
+"""ChartQuery.parse memoization.
+
+Parsing normalizes the chart name (number words, aliases, navaid names), so
+repeated queries reuse the frozen result instead of re-running that work.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from zoa_ref.charts import ChartQuery
+
+
+def test_parse_applies_alias():
+    """The TAXI alias expands to the airport diagram chart name."""
+    parsed = ChartQuery.parse("oak taxi")
+    assert parsed.airport == "OAK"
+    assert parsed.chart_name == "AIRPORT DIAGRAM"
+
+
+def test_repeated_parse_returns_cached_instance():
+    """Parsing the same query twice returns the same (immutable) object."""
+    assert ChartQuery.parse("SFO TAXI") is ChartQuery.parse("SFO TAXI")
+
+
+def test_parsed_query_is_immutable():
+    """Cached instances are shared, so they must not be mutable."""
+    parsed = ChartQuery.parse("SJC TAXI")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        parsed.airport = "OAK"  # type: ignore[misc]
+
+
+def test_invalid_query_still_raises():
+    """Errors are not cached; every bad query raises."""
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            ChartQuery.parse("OAK")
+
+
+def test_case_and_spacing_variants_share_cache_entry():
+    """Queries differing only in case/whitespace hit the same cached result."""
+    assert ChartQuery.parse("rno  taxi ") is ChartQuery.parse("RNO TAXI")
+
+
+def test_from_parts_matches_parse():
+    """Pre-split tokens resolve to the same cached query as the raw string."""
+    assert ChartQuery.from_parts(["SFO", "TAXI"]) is ChartQuery.parse("sfo taxi")
+    with pytest.raises(ValueError):
+        ChartQuery.from_parts(["SFO"])
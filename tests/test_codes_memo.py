@@ -0,0 +1,33 @@
+"""In-memory reuse of code search results in CodesPage."""
+
+from __future__ import annotations
+
+from zoa_ref import icao
+
+
+def test_recent_result_is_reused():
+    """A repeat search within the TTL comes from memory, case-insensitively."""
+    page = icao.CodesPage(session=None)
+    page._remember("airline", "UAL", ["United"])
+    assert page._memoized("airline", "ual") == ["United"]
+
+
+def test_expired_result_is_dropped(monkeypatch):
+    """After the TTL the remembered result is discarded."""
+    page = icao.CodesPage(session=None)
+    page._remember("airport", "KSFO", ["San Francisco"])
+    monkeypatch.setattr(icao.time, "monotonic", lambda: 1e12)
+    assert page._memoized("airport", "KSFO") is None
+    assert not page._memo
+
+
+def test_oldest_result_is_evicted(monkeypatch):
+    """Past CODES_MEMO_SIZE entries the least recently used goes first."""
+    monkeypatch.setattr(icao, "CODES_MEMO_SIZE", 2)
+    page = icao.CodesPage(session=None)
+    page._remember("aircraft", "B738", ["B737-800"])
+    page._remember("aircraft", "A320", ["A320"])
+    page._memoized("aircraft", "B738")
+    page._remember("aircraft", "C172", ["Skyhawk"])
+    assert page._memoized("aircraft", "A320") is None
+    assert page._memoized("aircraft", "B738") == ["B737-800"]
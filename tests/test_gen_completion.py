@@ -0,0 +1,100 @@
+"""CLI tests for the 'gen-completion' command."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+
+import pytest
+from click.testing import CliRunner
+
+from zoa_ref.cli import main
+
+
+@pytest.fixture()
+def script() -> str:
+    result = CliRunner().invoke(main, ["gen-completion", "bash"])
+    assert result.exit_code == 0
+    return result.output
+
+
+def test_static_candidates_are_inlined(script: str):
+    """Airport and chart type arguments are answered without Python."""
+    assert 'atis:1) words="OAK RNO SFO SJC SMF" ;;' in script
+    assert 'list:2) words="APD APP DP IAP SID STAR TAXI" ;;' in script
+
+
+def test_dynamic_completers_call_back_into_click(script: str):
+    """Chart names depend on the cache, so they still go through Click."""
+    assert 'chart:*) _zoa_completion_dynamic "$1"; return 0 ;;' in script
+    assert "_ZOA_COMPLETE=bash_complete" in script
+
+
+def test_output_is_only_the_script(script: str):
+    """No console title or terminal escapes leak into the redirected file."""
+    assert script.startswith("# bash completion for zoa")
+    assert "\033" not in script
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="bash not installed")
+def test_script_completes_airports(script: str, tmp_path):
+    """Sourcing the script completes route airports case-insensitively."""
+    path = tmp_path / "zoa.bash"
+    path.write_text(script)
+    probe = (
+        f"source {path}; COMP_WORDS=(zoa route sf); COMP_CWORD=2; "
+        'COMPREPLY=(); _zoa_completion zoa; echo "${COMPREPLY[*]}"'
+    )
+    result = subprocess.run(
+        ["bash", "-c", probe], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["SFO"]
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="bash not installed")
+def test_repeated_dynamic_completion_is_reused(script: str, tmp_path):
+    """Asking again for the same line doesn't start the CLI a second time."""
+    path = tmp_path / "zoa.bash"
+    path.write_text(script)
+    log = tmp_path / "calls.log"
+    fake_cli = tmp_path / "fake-zoa"
+    fake_cli.write_text(f'#!/bin/sh\necho call >> {log}\necho "plain,OAK"\n')
+    fake_cli.chmod(0o755)
+    probe = (
+        f"source {path}; COMP_WORDS=(zoa chart o); COMP_CWORD=2; "
+        f"for n in 1 2; do COMPREPLY=(); _zoa_completion {fake_cli}; done; "
+        'echo "${COMPREPLY[*]}"'
+    )
+    result = subprocess.run(
+        ["bash", "-c", probe], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["OAK"]
+    assert log.read_text().split() == ["call"]
+
+
+def test_prog_name_targets_standalone_binary():
+    """The frozen binary gets its own function and Click completion var."""
+    result = CliRunner().invoke(
+        main, ["gen-completion", "bash", "--prog-name", "zoa-reference-cli"]
+    )
+    assert result.exit_code == 0
+    assert "complete -F _zoa_reference_cli_completion zoa-reference-cli" in (
+        result.output
+    )
+    assert "_ZOA_REFERENCE_CLI_COMPLETE=bash_complete" in result.output
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="bash not installed")
+def test_option_values_are_not_positionals(script: str, tmp_path):
+    """In 'route --top 5 SFO o', the 5 belongs to --top; 'o' is the arrival."""
+    path = tmp_path / "zoa.bash"
+    path.write_text(script)
+    probe = (
+        f"source {path}; COMP_WORDS=(zoa route --top 5 SFO o); COMP_CWORD=5; "
+        'COMPREPLY=(); _zoa_completion zoa; echo "${COMPREPLY[*]}"; '
+        "shopt -q nocasematch && echo nocasematch-leaked || true"
+    )
+    result = subprocess.run(
+        ["bash", "-c", probe], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["OAK"]
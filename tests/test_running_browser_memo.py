@@ -0,0 +1,47 @@
+"""Short-lived reuse of the detected running browser in get_running_browser."""
+
+from __future__ import annotations
+
+import pytest
+
+from zoa_ref import cli_utils
+
+
+@pytest.fixture
+def fake_scan(monkeypatch):
+    """Answer "chrome" from the process scan and count the scans made."""
+    scans: list[int] = []
+
+    def fake_detect():
+        scans.append(1)
+        return "chrome"
+
+    monkeypatch.setattr(cli_utils, "_detect_running_browser", fake_detect)
+    monkeypatch.setattr(cli_utils, "_running_browser_memo", None)
+    return scans
+
+
+def test_repeat_lookup_reuses_scan(fake_scan):
+    """Opening charts back to back reads the process table once."""
+    assert cli_utils.get_running_browser() == "chrome"
+    assert cli_utils.get_running_browser() == "chrome"
+    assert len(fake_scan) == 1
+
+
+def test_expired_answer_rescans(fake_scan, monkeypatch):
+    """After the TTL the process table is read again."""
+    cli_utils.get_running_browser()
+    monkeypatch.setattr(cli_utils.time, "monotonic", lambda: 1e12)
+    cli_utils.get_running_browser()
+    assert len(fake_scan) == 2
+
+
+def test_clearing_preference_forgets_answer(fake_scan, monkeypatch, tmp_path):
+    """Changing the browser preference drops the remembered answer."""
+    from zoa_ref import config
+
+    monkeypatch.setattr(config, "BROWSER_PREF_FILE", tmp_path / "browser_pref.txt")
+    cli_utils.get_running_browser()
+    assert cli_utils.clear_browser_preference()
+    cli_utils.get_running_browser()
+    assert len(fake_scan) == 2
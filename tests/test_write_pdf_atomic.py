@@ -0,0 +1,25 @@
+"""Crash-safe writes of processed chart PDFs in _write_pdf_atomic."""
+
+from __future__ import annotations
+
+import pytest
+
+from zoa_ref.charts import _write_pdf_atomic
+
+
+def test_write_leaves_only_the_pdf(tmp_path):
+    """A successful write renames its temp file into place."""
+    out = tmp_path / "OAK_CNDEL5.pdf"
+    _write_pdf_atomic(str(out), b"%PDF-1.7")
+    assert out.read_bytes() == b"%PDF-1.7"
+    assert [p.name for p in tmp_path.iterdir()] == ["OAK_CNDEL5.pdf"]
+
+
+def test_failed_write_keeps_old_pdf_and_no_temp_file(tmp_path):
+    """A write that raises leaves the previous PDF and no .partial behind."""
+    out = tmp_path / "OAK_CNDEL5.pdf"
+    out.write_bytes(b"old")
+    with pytest.raises(TypeError):
+        _write_pdf_atomic(str(out), "not bytes")  # type: ignore[arg-type]
+    assert out.read_bytes() == b"old"
+    assert [p.name for p in tmp_path.iterdir()] == ["OAK_CNDEL5.pdf"]